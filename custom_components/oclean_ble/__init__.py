@@ -6,19 +6,22 @@ import json
 import logging
 import logging.handlers
 import pathlib
+import queue
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.const import __version__ as HA_VERSION
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 
 from .const import (
     CONF_DEVICE_NAME,
+    CONF_FILE_LOG_LEVEL,
     CONF_MAC_ADDRESS,
     CONF_POLL_INTERVAL,
     CONF_POLL_WINDOWS,
     CONF_POST_BRUSH_COOLDOWN,
+    DEFAULT_FILE_LOG_LEVEL,
     DEFAULT_POLL_INTERVAL,
     DEFAULT_POST_BRUSH_COOLDOWN,
     DOMAIN,
@@ -27,6 +30,8 @@ from .const import (
 from .coordinator import OcleanCoordinator
 
 _LOGGER = logging.getLogger(__name__)
+# Package logger that receives the file handler (covers all oclean_ble modules)
+_OCLEAN_LOGGER = logging.getLogger("custom_components.oclean_ble")
 _MANIFEST = json.loads((pathlib.Path(__file__).parent / "manifest.json").read_text())
 _INTEGRATION_VERSION = _MANIFEST.get("version", "unknown")
 
@@ -38,8 +43,17 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
-# Key under hass.data[DOMAIN] where the shared file handler is stored
+# Key under hass.data[DOMAIN] where the shared file logging objects are stored
+# as a (queue_handler, listener, file_handler) tuple
 _FILE_HANDLER_KEY = "_file_handler"
+# Key under hass.data[DOMAIN] where the HA-stop listener's remove callback is stored
+_STOP_LISTENER_KEY = "_file_stop_listener"
+
+# Shared by every file handler built in this HA session (formatters are stateless)
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s  %(levelname)-8s  [%(name)s]  %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 
 def _build_file_handler(log_path: pathlib.Path) -> logging.handlers.RotatingFileHandler:
@@ -51,12 +65,7 @@ def _build_file_handler(log_path: pathlib.Path) -> logging.handlers.RotatingFile
         encoding="utf-8",
     )
     handler.setLevel(logging.DEBUG)
-    handler.setFormatter(
-        logging.Formatter(
-            fmt="%(asctime)s  %(levelname)-8s  [%(name)s]  %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-    )
+    handler.setFormatter(_FORMATTER)
     return handler
 
 
@@ -65,10 +74,20 @@ async def _attach_file_handler(hass: HomeAssistant) -> None:
 
     Log file: <config_dir>/oclean_ble.log
     Max size:  1 MB, 2 rotated backups (≤ 3 MB total)
-    Level:     DEBUG – all unknown-byte traces and raw hex dumps included.
+    Level:     INFO by default; DEBUG (all unknown-byte traces and raw hex dumps)
+               when selected in the options – see _apply_file_log_level().
+
+    The logger only gets a QueueHandler, which enqueues the record and returns.
+    A QueueListener thread drains the queue into the file handler, so write(),
+    rollover rename and open() never run on the event loop or occupy an
+    executor thread.
 
     The handler is shared across multiple config entries (multiple devices).
-    It is removed when the last entry is unloaded.
+    It is removed when the last entry is unloaded, or on HA stop so that
+    records still queued for the (daemon) listener thread reach the file.
+
+    Callers that build expensive DEBUG arguments (e.g. ``data.hex()``) should
+    guard them with ``_LOGGER.isEnabledFor(logging.DEBUG)``.
     """
     domain_data = hass.data.setdefault(DOMAIN, {})
     if _FILE_HANDLER_KEY in domain_data:
@@ -80,40 +99,80 @@ async def _attach_file_handler(hass: HomeAssistant) -> None:
 
     log_path = pathlib.Path(hass.config.config_dir) / "oclean_ble.log"
     # open() is blocking – run in the default executor to avoid loop warnings
-    handler = await hass.async_add_executor_job(_build_file_handler, log_path)
+    file_handler = await hass.async_add_executor_job(_build_file_handler, log_path)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(logging.getLevelNamesMapping()[DEFAULT_FILE_LOG_LEVEL])
 
-    oclean_logger = logging.getLogger("custom_components.oclean_ble")
-    oclean_logger.addHandler(handler)
-    domain_data[_FILE_HANDLER_KEY] = handler
+    _OCLEAN_LOGGER.addHandler(queue_handler)
+    domain_data[_FILE_HANDLER_KEY] = (queue_handler, listener, file_handler)
+
+    async def _on_stop(_event: Event) -> None:
+        # A listen_once listener must not be removed after it has fired
+        domain_data.pop(_STOP_LISTENER_KEY, None)
+        await _detach_file_handler(hass)
+
+    domain_data[_STOP_LISTENER_KEY] = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _on_stop)
     _LOGGER.info("Oclean log file: %s", log_path)
 
 
 async def _detach_file_handler(hass: HomeAssistant) -> None:
-    """Remove the file handler when the last entry is unloaded."""
+    """Remove the file handler when the last entry is unloaded (or HA stops)."""
     domain_data = hass.data.get(DOMAIN, {})
-    handler = domain_data.pop(_FILE_HANDLER_KEY, None)
-    if handler is None:
+    remove_stop_listener = domain_data.pop(_STOP_LISTENER_KEY, None)
+    if remove_stop_listener is not None:
+        remove_stop_listener()
+    handlers = domain_data.pop(_FILE_HANDLER_KEY, None)
+    if handlers is None:
         return
-    oclean_logger = logging.getLogger("custom_components.oclean_ble")
-    oclean_logger.removeHandler(handler)
-    # handler.close() flushes and closes the underlying file – run in executor
-    await hass.async_add_executor_job(handler.close)
+    queue_handler, listener, file_handler = handlers
+    _OCLEAN_LOGGER.removeHandler(queue_handler)
+    # stop() joins the listener thread after it drained the queue; close()
+    # flushes and closes the underlying file – both blocking, run in executor
+    await hass.async_add_executor_job(listener.stop)
+    await hass.async_add_executor_job(file_handler.close)
     _LOGGER.debug("Oclean file log handler detached")
 
 
+def _apply_file_log_level(hass: HomeAssistant, exclude_entry_id: str | None = None) -> None:
+    """Set the shared file handler to the most verbose level any entry asks for.
+
+    Records below this level are dropped by the QueueHandler before they are
+    enqueued, so INFO (the default) keeps hex dumps out of the file entirely.
+    *exclude_entry_id* leaves out an entry that is being unloaded (it is still
+    listed by async_entries() at that point).
+    """
+    handlers = hass.data.get(DOMAIN, {}).get(_FILE_HANDLER_KEY)
+    if handlers is None:
+        return  # not attached yet – the attaching entry applies the level
+    level_names = logging.getLevelNamesMapping()
+    levels = [
+        level_names[entry.options.get(CONF_FILE_LOG_LEVEL, DEFAULT_FILE_LOG_LEVEL)]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != exclude_entry_id
+    ]
+    handlers[0].setLevel(min(levels, default=level_names[DEFAULT_FILE_LOG_LEVEL]))
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Oclean from a config entry."""
     await _attach_file_handler(hass)
+    _apply_file_log_level(hass)
 
-    mac = entry.data[CONF_MAC_ADDRESS]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "Oclean")
-    poll_interval = entry.options.get(
+    data = entry.data
+    options = entry.options
+    mac = data[CONF_MAC_ADDRESS]
+    device_name = data.get(CONF_DEVICE_NAME, "Oclean")
+    poll_interval = options.get(
         CONF_POLL_INTERVAL,
-        entry.data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
+        data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
     )
 
-    poll_windows = entry.options.get(CONF_POLL_WINDOWS, "")
-    post_brush_cooldown_h = int(entry.options.get(CONF_POST_BRUSH_COOLDOWN, DEFAULT_POST_BRUSH_COOLDOWN))
+    poll_windows = options.get(CONF_POLL_WINDOWS, "")
+    post_brush_cooldown_h = int(options.get(CONF_POST_BRUSH_COOLDOWN, DEFAULT_POST_BRUSH_COOLDOWN))
 
     _LOGGER.info(
         "Oclean integration v%s starting: mac=%s name=%s (HA %s)",
@@ -131,6 +190,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = OcleanCoordinator(
         hass,
+        entry,
         mac,
         device_name,
         poll_interval,
@@ -144,6 +204,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # successful poll.
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    # Flush the delayed per-poll store write before a reload re-reads the file
+    entry.async_on_unload(coordinator.async_flush_store)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Listen for option updates (e.g. changed poll interval)
@@ -184,12 +247,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id, None)
         # Remove file handler and poll service only when no more entries remain
-        remaining = [k for k in hass.data.get(DOMAIN, {}) if not k.startswith("_")]
-        if not remaining:
+        if not any(not k.startswith("_") for k in domain_data):
             await _detach_file_handler(hass)
             hass.services.async_remove(DOMAIN, SERVICE_POLL)
+        else:
+            # Drop back from DEBUG if the unloaded entry was the one asking for it
+            _apply_file_log_level(hass, exclude_entry_id=entry.entry_id)
     return unload_ok
 
 
@@ -40,7 +40,9 @@ async def async_setup_entry(
     mac = entry.data[CONF_MAC_ADDRESS]
     device_name = entry.data.get(CONF_DEVICE_NAME, "Oclean")
 
-    async_add_entities(OcleanButton(coordinator, description, mac, device_name) for description in BUTTON_DESCRIPTIONS)
+    async_add_entities(
+        [OcleanButton(coordinator, description, mac, device_name) for description in BUTTON_DESCRIPTIONS]
+    )
 
 
 class OcleanButton(OcleanEntity, ButtonEntity):
@@ -15,6 +15,7 @@ from homeassistant.helpers import selector
 
 from .const import (
     CONF_DEVICE_NAME,
+    CONF_FILE_LOG_LEVEL,
     CONF_MAC_ADDRESS,
     CONF_POLL_INTERVAL,
     CONF_POLL_WINDOWS,
@@ -22,9 +23,11 @@ from .const import (
     CONF_WINDOW_COUNT,
     CONF_WINDOW_END,
     CONF_WINDOW_START,
+    DEFAULT_FILE_LOG_LEVEL,
     DEFAULT_POLL_INTERVAL,
     DEFAULT_POST_BRUSH_COOLDOWN,
     DOMAIN,
+    FILE_LOG_LEVELS,
     MIN_POLL_INTERVAL,
     OCLEAN_SERVICE_UUID,
     POLL_INTERVAL_MANUAL,
@@ -32,7 +35,63 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$")
+_OCLEAN_UUID_LC = OCLEAN_SERVICE_UUID.lower()
+# Upper bound for the device picker; stops scanning dense BLE environments early
+_MAX_DISCOVERED_DEVICES = 20
+
+# Used with fullmatch(), so no ^/$ anchors; case-insensitive so the input
+# only needs upper-casing once it is known to be valid.
+_MAC_RE = re.compile(r"[0-9A-F]{2}(?::[0-9A-F]{2}){5}", re.IGNORECASE)
+_MAC_FULLMATCH = _MAC_RE.fullmatch
+
+# One stored poll window: "HH:MM-HH:MM" (whitespace is removed before matching)
+_WINDOW_RE = re.compile(r"([0-9]{1,2}):([0-9]{2})-([0-9]{1,2}):([0-9]{2})")
+_DEL_SPACES = str.maketrans("", "", " \t\r\n")
+
+# Selectors and schemas are immutable – build them once at import and reuse
+# them for every form render.  Only fields with per-entry defaults or
+# per-flow choices are assembled in the steps.
+_POLL_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=POLL_INTERVAL_MANUAL,
+        max=86400,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_COOLDOWN_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=23,
+        step=1,
+        unit_of_measurement="h",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_WINDOW_COUNT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=3, step=1, mode=selector.NumberSelectorMode.BOX)
+)
+_TIME_SELECTOR = selector.TimeSelector()
+
+_CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): _POLL_INTERVAL_SELECTOR,
+    }
+)
+_WINDOW_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_WINDOW_START): _TIME_SELECTOR,
+        vol.Required(CONF_WINDOW_END): _TIME_SELECTOR,
+    }
+)
+_MANUAL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_MAC_ADDRESS): str,
+        vol.Optional(CONF_DEVICE_NAME, default="Oclean"): str,
+        vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): _POLL_INTERVAL_SELECTOR,
+    }
+)
 
 
 def _poll_interval_error(poll_interval: int) -> str | None:
@@ -47,31 +106,21 @@ def _parse_windows_list(windows_str: str) -> list[tuple[str, str]]:
 
     The ':00' suffix makes the values directly usable as TimeSelector defaults.
     """
-    result: list[tuple[str, str]] = []
-    for part in (windows_str or "").split(",")[:3]:
-        part = part.strip()
-        if "-" not in part:
-            continue
-        try:
-            s_raw, e_raw = part.split("-", 1)
-            s_raw, e_raw = s_raw.strip(), e_raw.strip()
-            sh, sm = s_raw.split(":")
-            eh, em = e_raw.split(":")
-            int(sh), int(sm), int(eh), int(em)  # validate
-        except (ValueError, AttributeError):
-            continue
-        result.append((f"{s_raw}:00", f"{e_raw}:00"))
-    return result
+    parts = (windows_str or "").translate(_DEL_SPACES).split(",")[:3]
+    matches = (_WINDOW_RE.fullmatch(part) for part in parts)
+    return [(f"{m[1]}:{m[2]}:00", f"{m[3]}:{m[4]}:00") for m in matches if m]
 
 
 def _windows_list_to_str(windows: list[tuple[str, str]]) -> str:
-    """Combine ('HH:MM:SS', 'HH:MM:SS') tuples into 'HH:MM-HH:MM[, ...]' for storage."""
-    parts: list[str] = []
-    for s, e in windows:
-        s5, e5 = s[:5], e[:5]  # "HH:MM:SS" → "HH:MM"
-        if s5 and e5 and s5 != e5:
-            parts.append(f"{s5}-{e5}")
-    return ", ".join(parts)
+    """Combine ('HH:MM:SS', 'HH:MM:SS') tuples into 'HH:MM-HH:MM[, ...]' for storage.
+
+    Empty or zero-length windows (start == end) are dropped.
+    """
+    return ", ".join(
+        s5 + "-" + e5
+        for s5, e5 in ((s[:5], e[:5]) for s, e in windows)  # "HH:MM:SS" → "HH:MM"
+        if s5 and e5 and s5 != e5
+    )
 
 
 class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
@@ -79,8 +128,14 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
 
     VERSION = 1
 
+    # The HA base classes keep a __dict__; the slots only give our own state
+    # fixed-offset attribute access.
+    __slots__ = ("_device_options", "_discovered_devices", "_mac", "_name")
+
     def __init__(self) -> None:
         self._discovered_devices: dict[str, str] = {}  # mac -> name
+        # Picker labels derived from _discovered_devices; None = rebuild on next render
+        self._device_options: dict[str, str] | None = None
         self._mac: str | None = None
         self._name: str | None = None
 
@@ -120,19 +175,7 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
             step_id="confirm",
             errors=errors,
             description_placeholders={"name": self._name, "mac": self._mac},
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=POLL_INTERVAL_MANUAL,
-                            max=86400,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_CONFIRM_SCHEMA,
         )
 
     # ------------------------------------------------------------------
@@ -141,11 +184,20 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step – show discovered devices or manual entry."""
-        # Scan for already-discovered Oclean devices
-        discovered = bluetooth.async_discovered_service_info(self.hass)
-        for info in discovered:
-            if OCLEAN_SERVICE_UUID.lower() in [s.lower() for s in info.service_uuids]:
-                self._discovered_devices[info.address] = info.name or info.address
+        # Scan for already-discovered Oclean devices that are not configured yet.
+        # Devices found earlier in this flow are reused instead of rescanning.
+        if not self._discovered_devices:
+            configured = self._async_current_ids(include_ignore=False)
+            discovered = bluetooth.async_discovered_service_info(self.hass)
+            for info in discovered:
+                if info.address in configured:
+                    continue
+                # Remote scanners and proxies may not lower-case service UUIDs
+                if any(s.lower() == _OCLEAN_UUID_LC for s in info.service_uuids):
+                    self._discovered_devices[info.address] = info.name or info.address
+                    self._device_options = None
+                    if len(self._discovered_devices) >= _MAX_DISCOVERED_DEVICES:
+                        break
 
         if self._discovered_devices and user_input is None:
             return await self.async_step_pick_device()
@@ -175,23 +227,16 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
                     },
                 )
 
-        device_options = {mac: f"{name} ({mac})" for mac, name in self._discovered_devices.items()}
+        if self._device_options is None:
+            self._device_options = {mac: f"{name} ({mac})" for mac, name in self._discovered_devices.items()}
 
         return self.async_show_form(
             step_id="pick_device",
             errors=errors,
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_MAC_ADDRESS): vol.In(device_options),
-                    vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=POLL_INTERVAL_MANUAL,
-                            max=86400,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
+                    vol.Required(CONF_MAC_ADDRESS): vol.In(self._device_options),
+                    vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): _POLL_INTERVAL_SELECTOR,
                 }
             ),
         )
@@ -201,10 +246,11 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            mac = user_input[CONF_MAC_ADDRESS].upper().strip()
-            if not _MAC_RE.match(mac):
+            mac = user_input[CONF_MAC_ADDRESS].strip()
+            if _MAC_FULLMATCH(mac) is None:
                 errors[CONF_MAC_ADDRESS] = "invalid_mac"
             else:
+                mac = mac.upper()
                 poll_interval = int(user_input.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL))
                 if err := _poll_interval_error(poll_interval):
                     errors[CONF_POLL_INTERVAL] = err
@@ -223,21 +269,7 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
         return self.async_show_form(
             step_id="manual",
             errors=errors,
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_MAC_ADDRESS): str,
-                    vol.Optional(CONF_DEVICE_NAME, default="Oclean"): str,
-                    vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=POLL_INTERVAL_MANUAL,
-                            max=86400,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_MANUAL_SCHEMA,
         )
 
     # ------------------------------------------------------------------
@@ -254,20 +286,33 @@ class OcleanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
 class OcleanOptionsFlow(config_entries.OptionsFlow):
     """Handle Oclean options via a multi-step flow.
 
-    Step 1 (init):     poll interval, post-brush cooldown, number of poll windows (0-3)
+    Step 1 (init):     poll interval, post-brush cooldown, log file level, number of poll windows (0-3)
     Step 2-4 (window_1/2/3): one TimeSelector pair per requested window
 
     Note: self.config_entry is injected automatically by HA since 2024.3.
     """
 
+    __slots__ = (
+        "_collected_windows",
+        "_cooldown",
+        "_existing_windows",
+        "_file_log_level",
+        "_poll_interval",
+        "_window_count",
+        "_window_steps",
+    )
+
     def __init__(self) -> None:
         self._poll_interval: int = DEFAULT_POLL_INTERVAL
         self._cooldown: int = DEFAULT_POST_BRUSH_COOLDOWN
+        self._file_log_level: str = DEFAULT_FILE_LOG_LEVEL
         self._window_count: int = 0
         # Windows parsed from the current config – used to pre-fill each window step.
         self._existing_windows: list[tuple[str, str]] = []
         # Windows collected step-by-step as the user fills them in.
         self._collected_windows: list[tuple[str, str]] = []
+        # Window steps by 0-based index, so window N chains to _window_steps[N].
+        self._window_steps = (self.async_step_window_1, self.async_step_window_2, self.async_step_window_3)
 
     # ------------------------------------------------------------------
     # Step 1 – global settings + window count
@@ -281,6 +326,7 @@ class OcleanOptionsFlow(config_entries.OptionsFlow):
                 errors[CONF_POLL_INTERVAL] = err
             else:
                 self._cooldown = int(user_input.get(CONF_POST_BRUSH_COOLDOWN, DEFAULT_POST_BRUSH_COOLDOWN))
+                self._file_log_level = user_input.get(CONF_FILE_LOG_LEVEL, DEFAULT_FILE_LOG_LEVEL)
                 self._window_count = int(user_input.get(CONF_WINDOW_COUNT, 0))
                 self._collected_windows = []
                 if self._window_count > 0:
@@ -290,6 +336,7 @@ class OcleanOptionsFlow(config_entries.OptionsFlow):
                     data={
                         CONF_POLL_INTERVAL: self._poll_interval,
                         CONF_POST_BRUSH_COOLDOWN: self._cooldown,
+                        CONF_FILE_LOG_LEVEL: self._file_log_level,
                         CONF_POLL_WINDOWS: "",
                     },
                 )
@@ -299,6 +346,7 @@ class OcleanOptionsFlow(config_entries.OptionsFlow):
             self.config_entry.data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
         )
         current_cooldown = int(self.config_entry.options.get(CONF_POST_BRUSH_COOLDOWN, DEFAULT_POST_BRUSH_COOLDOWN))
+        current_log_level = self.config_entry.options.get(CONF_FILE_LOG_LEVEL, DEFAULT_FILE_LOG_LEVEL)
         self._existing_windows = _parse_windows_list(self.config_entry.options.get(CONF_POLL_WINDOWS, ""))
         current_count = len(self._existing_windows)
 
@@ -307,27 +355,10 @@ class OcleanOptionsFlow(config_entries.OptionsFlow):
             errors=errors,
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_POLL_INTERVAL, default=current_interval): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=POLL_INTERVAL_MANUAL,
-                            max=86400,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Optional(CONF_POST_BRUSH_COOLDOWN, default=current_cooldown): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=23,
-                            step=1,
-                            unit_of_measurement="h",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Optional(CONF_WINDOW_COUNT, default=current_count): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0, max=3, step=1, mode=selector.NumberSelectorMode.BOX)
-                    ),
+                    vol.Required(CONF_POLL_INTERVAL, default=current_interval): _POLL_INTERVAL_SELECTOR,
+                    vol.Optional(CONF_POST_BRUSH_COOLDOWN, default=current_cooldown): _COOLDOWN_SELECTOR,
+                    vol.Optional(CONF_FILE_LOG_LEVEL, default=current_log_level): vol.In(FILE_LOG_LEVELS),
+                    vol.Optional(CONF_WINDOW_COUNT, default=current_count): _WINDOW_COUNT_SELECTOR,
                 }
             ),
         )
@@ -359,34 +390,32 @@ class OcleanOptionsFlow(config_entries.OptionsFlow):
             if not errors:
                 self._collected_windows.append((s, e))
                 if num < self._window_count:
-                    return await getattr(self, f"async_step_window_{num + 1}")()
+                    return await self._window_steps[num]()
                 return self.async_create_entry(
                     title="",
                     data={
                         CONF_POLL_INTERVAL: self._poll_interval,
                         CONF_POST_BRUSH_COOLDOWN: self._cooldown,
+                        CONF_FILE_LOG_LEVEL: self._file_log_level,
                         CONF_POLL_WINDOWS: _windows_list_to_str(self._collected_windows),
                     },
                 )
 
         # Pre-populate from current config if this window already existed.
-        existing = self._existing_windows[num - 1] if num - 1 < len(self._existing_windows) else None
-        s_default = existing[0] if existing else None
-        e_default = existing[1] if existing else None
+        # _parse_windows_list() only yields complete (start, end) pairs.
+        if num - 1 < len(self._existing_windows):
+            s_default, e_default = self._existing_windows[num - 1]
+            data_schema = vol.Schema(
+                {
+                    vol.Required(CONF_WINDOW_START, default=s_default): _TIME_SELECTOR,
+                    vol.Required(CONF_WINDOW_END, default=e_default): _TIME_SELECTOR,
+                }
+            )
+        else:
+            data_schema = _WINDOW_SCHEMA
 
         return self.async_show_form(
             step_id=f"window_{num}",
             errors=errors,
-            data_schema=vol.Schema(
-                {
-                    (
-                        vol.Required(CONF_WINDOW_START, default=s_default)
-                        if s_default
-                        else vol.Required(CONF_WINDOW_START)
-                    ): selector.TimeSelector(),
-                    (
-                        vol.Required(CONF_WINDOW_END, default=e_default) if e_default else vol.Required(CONF_WINDOW_END)
-                    ): selector.TimeSelector(),
-                }
-            ),
+            data_schema=data_schema,
         )
@@ -7,10 +7,11 @@ import contextlib
 import dataclasses
 import datetime
 import logging
+import operator
+import re
 import struct
 import time
-import traceback
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from datetime import time as _dtime
 from datetime import timedelta
 from typing import Any
@@ -19,6 +20,7 @@ from bleak import BleakClient, BleakError
 from bleak.backends.device import BLEDevice
 from bleak_retry_connector import establish_connection
 from homeassistant.components import bluetooth
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.storage import Store
@@ -37,6 +39,7 @@ from .const import (
     BLE_POLL_TOTAL_TIMEOUT,
     BLE_POST_CONNECT_DELAY,
     BLE_READ_FALLBACK_DELAY,
+    BLE_READY_PROBE_TIMEOUT,
     BLE_SUBSCRIBE_FIRST_TIMEOUT,
     BLE_SUBSCRIBE_RETRY_TIMEOUT,
     BLE_WRITE_TIMEOUT,
@@ -78,6 +81,7 @@ from .const import (
     READ_NOTIFY_CHAR_UUID,
     RECEIVE_BRUSH_UUID,
     SCHEMES_BY_MODEL,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
     WRITE_CHAR_UUID,
 )
@@ -100,6 +104,16 @@ _LOGGER = logging.getLogger(__name__)
 # stale subscription state left over from a previous bonded or crashed connection.
 _CCCD_UUID = "00002902-0000-1000-8000-00805f9b34fb"
 
+# Type-0 time-calibration command: 2-byte 020E prefix + big-endian uint32 unix
+# timestamp, packed in one call so the command is built with a single allocation
+_CALIBRATE_TIME_STRUCT = struct.Struct(">2sI")
+
+# Sort/max key for entries of all_sessions
+_session_ts = operator.itemgetter(DATA_LAST_BRUSH_TIME)
+
+# One poll window entry: "HH:MM-HH:MM", whitespace allowed around the times
+_POLL_WINDOW_RE = re.compile(r"\s*([0-9]{1,2}):([0-9]{2})\s*-\s*([0-9]{1,2}):([0-9]{2})\s*")
+
 
 async def _clear_cccd(client: BleakClient, char_uuid: str) -> None:
     """Write 0x0000 to the CCCD descriptor of *char_uuid*, suppressing all errors.
@@ -121,6 +135,28 @@ async def _clear_cccd(client: BleakClient, char_uuid: str) -> None:
         pass
 
 
+async def _wait_for_gatt_ready(client: BleakClient) -> bytes | None:
+    """Wait until the GATT table answers requests, at most BLE_POST_CONNECT_DELAY.
+
+    A proxy backend may still be processing the service table right after
+    establish_connection returns.  A successful read of the battery level proves
+    it is live, so the settle delay is skipped; if the probe fails or times out,
+    the remainder of the delay is slept as before.
+
+    Returns the raw battery level from the probe, or None if it failed.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + BLE_POST_CONNECT_DELAY
+    try:
+        raw = await asyncio.wait_for(client.read_gatt_char(BATTERY_CHAR_UUID), timeout=BLE_READY_PROBE_TIMEOUT)
+    except Exception:  # noqa: BLE001
+        remaining = deadline - loop.time()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return None
+    return bytes(raw)
+
+
 async def _try_subscribe_no_cccd(
     client: BleakClient,
     char_uuid: str,
@@ -208,8 +244,7 @@ class _CoordLoggerAdapter(logging.LoggerAdapter):
     def process(self, msg: str, kwargs: dict) -> tuple[str, dict]:  # type: ignore[override]
         coord: OcleanCoordinator = self.extra["coord"]  # type: ignore[index, assignment]
         model = coord._last_raw.get(DATA_MODEL_ID) or "?"
-        suffix = coord._mac.replace(":", "")[-2:].upper()
-        return f"[{model}/{suffix}] {msg}", kwargs
+        return f"[{model}/{coord._mac_suffix}] {msg}", kwargs
 
 
 def _patch_aioesphomeapi_uuid_parser() -> None:
@@ -257,16 +292,13 @@ def _parse_poll_windows(windows_str: str) -> list[tuple[_dtime, _dtime]]:
     """
     result: list[tuple[_dtime, _dtime]] = []
     for part in (windows_str or "").split(","):
-        part = part.strip()
-        if "-" not in part:
+        m = _POLL_WINDOW_RE.fullmatch(part)
+        if m is None:
             continue
         try:
-            s, e = part.split("-", 1)
-            sh, sm = s.strip().split(":")
-            eh, em = e.strip().split(":")
-            start = _dtime(int(sh), int(sm))
-            end = _dtime(int(eh), int(em))
-        except (ValueError, AttributeError):
+            start = _dtime(int(m[1]), int(m[2]))
+            end = _dtime(int(m[3]), int(m[4]))
+        except ValueError:  # hour/minute out of range
             continue
         if start != end:
             result.append((start, end))
@@ -384,6 +416,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
     def __init__(
         self,
         hass: HomeAssistant,
+        config_entry: ConfigEntry,
         mac_address: str,
         device_name: str,
         update_interval: int,
@@ -393,10 +426,16 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval) if update_interval > 0 else None,
+            # Skipped and failed polls return an equal snapshot; don't wake every
+            # entity for those (OcleanDeviceData is a dataclass, so == compares fields).
+            always_update=False,
         )
         self._mac = mac_address
+        # Last two MAC hex digits, shown in every log line by _CoordLoggerAdapter
+        self._mac_suffix = mac_address.replace(":", "")[-2:].upper()
         self._device_name = device_name
         # Carries raw dict across polls so sensors keep their last value on failure
         self._last_raw: dict[str, Any] = {}
@@ -409,8 +448,9 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
 
         # Persistent storage: tracks last imported session timestamp per device.
         # Storage key is unique per MAC so multi-device setups don't conflict.
-        _mac_slug = mac_address.replace(":", "_").lower()
-        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{_mac_slug}")
+        # Also the prefix of every statistic_id imported for this device.
+        self._mac_slug = mac_address.replace(":", "_").lower()
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{self._mac_slug}")
         # Unix timestamp (seconds) of the newest session already imported into HA statistics.
         # Sessions with last_brush_time > this value are considered new.
         self._last_session_ts: int = 0
@@ -443,6 +483,8 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
 
         # Smart polling: optional time windows + post-brush cooldown.
         self._poll_windows: list[tuple[_dtime, _dtime]] = _parse_poll_windows(poll_windows)
+        # Shown in the skip reason; formatted once since the windows never change
+        self._poll_windows_str: str = ", ".join(f"{s:%H:%M}-{e:%H:%M}" for s, e in self._poll_windows)
         self._post_brush_cooldown_s: int = post_brush_cooldown_h * 3600
         # Unix timestamp until which polls are suppressed after a new session.
         self._cooldown_until: float = 0.0
@@ -465,6 +507,8 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         skip_reason = self._poll_skip_reason()
         if skip_reason and self._last_raw:
             self._log.debug("poll skipped: %s", skip_reason)
+            if self.data is not None:
+                return self.data  # nothing was read, so the current snapshot still holds
             return OcleanDeviceData.from_dict(self._last_raw)
         if skip_reason:
             self._log.debug(
@@ -479,12 +523,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             # Catch all exceptions (BleakError, TimeoutError, IndexError from
             # habluetooth proxy backend, etc.) so HA can keep retrying rather
             # than crashing the integration.
-            self._log.debug(
-                "poll failed: %s (%s)\n%s",
-                err,
-                type(err).__name__,
-                traceback.format_exc(),
-            )
+            self._log.debug("poll failed: %s (%s)", err, type(err).__name__, exc_info=True)
             self.last_poll_successful = False
             if self._last_raw:
                 # Return stale data; sensors will remain available with old values
@@ -511,7 +550,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             max_attempts=3,
         )
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
 
             def _ack_handler(_sender: Any, raw: bytearray) -> None:
                 data = bytes(raw)
@@ -560,7 +599,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             max_attempts=3,
         )
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
             subscribed: list[str] = []
             for char_uuid in self._protocol.notify_chars:
                 try:
@@ -616,7 +655,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         )
         cmd = CMD_AREA_REMIND + bytes([0x01 if enabled else 0x00])
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
             await self._write_standalone(client, cmd)
             self._log.info("area remind set to %s", enabled)
         finally:
@@ -640,7 +679,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         )
         cmd = CMD_OVER_PRESSURE + bytes([0x01 if enabled else 0x00])
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
             await self._write_standalone(client, cmd)
             self._log.info("over pressure set to %s", enabled)
         finally:
@@ -664,7 +703,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         )
         cmd = CMD_REMIND_SWITCH + bytes([0x01 if enabled else 0x00])
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
             await self._write_standalone(client, cmd)
             self._log.info("remind switch set to %s", enabled)
         finally:
@@ -688,7 +727,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         )
         cmd = CMD_RUNNING_SWITCH + bytes([0x01 if enabled else 0x00])
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
             await self._write_standalone(client, cmd)
             self._log.info("running switch set to %s", enabled)
         finally:
@@ -712,7 +751,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         )
         cmd = CMD_BRUSH_HEAD_MAX_DAYS + days.to_bytes(2, "big")
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
             await self._write_standalone(client, cmd)
             self._log.info("brush head max days set to %d", days)
         finally:
@@ -751,7 +790,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             max_attempts=3,
         )
         try:
-            await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+            await _wait_for_gatt_ready(client)
 
             def _ack_handler(_sender: Any, raw: bytearray) -> None:
                 data = bytes(raw)
@@ -817,6 +856,24 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _safe_gatt(self, op: Awaitable[Any], desc: str, *, warn: bool = False) -> Any:
+        """Await a GATT operation; log a failure instead of raising.
+
+        Returns the operation's result, or None if it raised.  Failures are
+        logged at DEBUG level, or WARNING when *warn* is set.
+        """
+        try:
+            return await op
+        except Exception as err:  # noqa: BLE001
+            self._log.log(
+                logging.WARNING if warn else logging.DEBUG,
+                "%s failed: %s (%s)",
+                desc,
+                err,
+                type(err).__name__,
+            )
+            return None
+
     def _poll_skip_reason(self) -> str | None:
         """Return a human-readable reason to skip this poll, or None to proceed.
 
@@ -832,8 +889,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         if self._poll_windows:
             now_t = datetime.datetime.now().time()
             if not any(_in_window(s, e, now_t) for s, e in self._poll_windows):
-                windows_str = ", ".join(f"{s.strftime('%H:%M')}-{e.strftime('%H:%M')}" for s, e in self._poll_windows)
-                return f"outside poll windows ({windows_str})"
+                return f"outside poll windows ({self._poll_windows_str})"
 
         return None
 
@@ -863,6 +919,9 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             self._brush_head_max_days = stored.get("brush_head_max_days")
             self._brush_head_sw_count = stored.get("brush_head_sw_count", 0)
             self._active_scheme_pnum = stored.get("active_scheme_pnum")
+            # DIS values themselves are part of last_session; restoring the read
+            # time keeps the 24 h DIS cache valid across HA restarts.
+            self._dis_last_read_ts = stored.get("dis_last_read_ts", 0.0)
             last_session = stored.get("last_session", {})
             if last_session:
                 self._last_raw.update(last_session)
@@ -872,24 +931,38 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             )
         self._store_loaded = True
 
-    async def _save_store(self) -> None:
-        """Persist coordinator state to HA storage."""
+    def _store_data(self) -> dict[str, Any]:
+        """Return the coordinator state as persisted in HA storage."""
         last_session = {
             k: self._last_raw[k] for k in _PERSISTENT_KEYS if k in self._last_raw and self._last_raw[k] is not None
         }
-        await self._store.async_save(
-            {
-                "last_session_ts": self._last_session_ts,
-                "area_remind": self._area_remind,
-                "over_pressure": self._over_pressure,
-                "remind_switch": self._remind_switch,
-                "running_switch": self._running_switch,
-                "brush_head_max_days": self._brush_head_max_days,
-                "brush_head_sw_count": self._brush_head_sw_count,
-                "active_scheme_pnum": self._active_scheme_pnum,
-                "last_session": last_session,
-            }
-        )
+        return {
+            "last_session_ts": self._last_session_ts,
+            "area_remind": self._area_remind,
+            "over_pressure": self._over_pressure,
+            "remind_switch": self._remind_switch,
+            "running_switch": self._running_switch,
+            "brush_head_max_days": self._brush_head_max_days,
+            "brush_head_sw_count": self._brush_head_sw_count,
+            "active_scheme_pnum": self._active_scheme_pnum,
+            "dis_last_read_ts": self._dis_last_read_ts,
+            "last_session": last_session,
+        }
+
+    async def _save_store(self) -> None:
+        """Persist coordinator state to HA storage now (user-initiated changes)."""
+        await self._store.async_save(self._store_data())
+
+    async def async_flush_store(self) -> None:
+        """Write any delayed store save now; registered to run on entry unload.
+
+        Polls only schedule a delayed write.  An options change reloads the
+        entry and the new coordinator reads the file straight away, so the
+        pending state must be on disk first or already-imported sessions would
+        count as new again.  Store.async_save also cancels the pending write.
+        """
+        if self._store_loaded:
+            await self._save_store()
 
     async def _poll_device(self) -> dict[str, Any]:
         """Connect to the device, read data, then disconnect."""
@@ -949,16 +1022,18 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
                     await client.disconnect()
 
         self.last_poll_successful = True
-        collected[DATA_LAST_POLL] = int(time.time())
+        poll_end_ts = time.time()
+        collected[DATA_LAST_POLL] = int(poll_end_ts)
 
         # Count new sessions before _import_new_sessions updates _last_session_ts
-        new_session_count = sum(1 for s in all_sessions if s.get(DATA_LAST_BRUSH_TIME, 0) > self._last_session_ts)
+        # (every all_sessions entry carries a timestamp, see _accept)
+        last_session_ts = self._last_session_ts
+        new_session_count = sum(1 for s in all_sessions if _session_ts(s) > last_session_ts)
 
         # Import new sessions into HA long-term statistics
         if all_sessions:
-            mac_slug = self._mac.replace(":", "_").lower()
             new_ts = await import_new_sessions(
-                self.hass, mac_slug, self._device_name, all_sessions, self._last_session_ts
+                self.hass, self._mac_slug, self._device_name, all_sessions, self._last_session_ts
             )
             if new_ts > self._last_session_ts:
                 self._last_session_ts = new_ts
@@ -966,7 +1041,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
 
         # Post-brush cooldown: pause polling for N hours after a new session
         if new_session_count > 0 and self._post_brush_cooldown_s > 0:
-            self._cooldown_until = time.time() + self._post_brush_cooldown_s
+            self._cooldown_until = poll_end_ts + self._post_brush_cooldown_s
             self._log.info(
                 "post-brush cooldown: %d new session(s) detected, pausing polls for %.1f h",
                 new_session_count,
@@ -987,7 +1062,8 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             collected[DATA_BRUSH_HEAD_USAGE] = self._brush_head_sw_count
 
         # Merge with last known persistent data, then overwrite with fresh values
-        merged = {**{k: self._last_raw.get(k) for k in _PERSISTENT_KEYS}, **collected}
+        merged = {k: self._last_raw.get(k) for k in _PERSISTENT_KEYS}
+        merged.update(collected)
 
         # Clear stale enrichment fields (score/areas/pressure) when a NEW session is
         # detected but the current poll did not deliver enrichment data.  This prevents
@@ -1016,7 +1092,10 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
 
         # Persist after every successful poll so that battery, model, and session
         # fields survive an HA restart even when no new sessions were imported.
-        await self._save_store()
+        # The write is delayed and coalesced by the Store; the data is built
+        # when the write happens, so it always reflects the latest state;
+        # async_flush_store writes it out early when the entry unloads.
+        self._store.async_delay_save(self._store_data, STORAGE_SAVE_DELAY)
 
         return merged
 
@@ -1035,9 +1114,14 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             self._protocol.name,
             cached_model or "unknown",
         )
-        # Delay after connect: gives habluetooth's proxy backend time to finish
+        # Wait after connect: gives habluetooth's proxy backend time to finish
         # processing the GATT service table before we start issuing commands.
-        await asyncio.sleep(BLE_POST_CONNECT_DELAY)
+        # The readiness probe reads the battery level; keeping its value lets
+        # _read_battery_and_unsubscribe skip its own read at the end of the poll.
+        probe = await _wait_for_gatt_ready(client)
+        if probe is not None and (batt := parse_battery(probe)) is not None:
+            collected[DATA_BATTERY] = batt
+            self._log.debug("battery from readiness probe: %d%%", batt)
 
         all_sessions: list[dict[str, Any]] = []
         seen_ts: set[int] = set()
@@ -1108,7 +1192,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
                 collected.update(parsed)
             if incoming_ts and incoming_ts not in seen_ts:
                 seen_ts.add(incoming_ts)
-                all_sessions.append(dict(parsed))
+                all_sessions.append(parsed)  # parsers return a fresh dict per call
                 session_received.set()
 
         def _flush_t1_buffer() -> None:
@@ -1130,8 +1214,11 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
                 _accept(parse_fn(chunk, coverage_norm_threshold=norm_thr))
 
         def handler(_sender: Any, raw: bytearray) -> None:
+            # bytes() is required: the parser registry is keyed on data[:2],
+            # and bytearray/memoryview slices are unhashable.
             data = bytes(raw)
-            _log.debug("notification raw: %s", data.hex())
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug("notification raw: %s", data.hex())
 
             # --- Continuation packet for active *B# reassembly ---
             # While reassembly is active, every incoming packet is treated as
@@ -1232,7 +1319,7 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
           5. READ fallback for devices without CCCD (e.g. OCLEANA1)
           6. Session pagination (0309)
           7. Enrichment wait if sessions were received
-          8. Battery read (skipped if notification already delivered the value)
+          8. Battery read (skipped if the probe or a notification already delivered the value)
         """
         await self._calibrate_time(client)
         await self._read_device_info_service(client, collected)
@@ -1318,27 +1405,28 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         We merge them into the newest session so stats import receives complete data.
         """
         if all_sessions:
-            latest = max(all_sessions, key=lambda s: s.get(DATA_LAST_BRUSH_TIME, 0))
+            # _accept only appends sessions that carry a timestamp
+            latest = max(all_sessions, key=_session_ts)
             enriched = {k: collected[k] for k in _ENRICHMENT_KEYS if k in collected and k not in latest}
             if enriched:
                 latest.update(enriched)
                 self._log.debug("session snapshot enriched: %s", list(enriched.keys()))
 
+        if not self._log.isEnabledFor(logging.DEBUG):
+            return
+        # One record for the whole listing instead of one per session
+        lines: list[str] = []
+        for i, s in enumerate(all_sessions):
+            ts = s.get(DATA_LAST_BRUSH_TIME, 0)
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)) if ts else "n/a"
+            status = "NEW" if ts > self._last_session_ts else "known"
+            lines.append(f"\n session[{i}]: ts={ts} ({when})  {status}")
         self._log.debug(
-            "fetched %d session(s) total from device (last_known_ts=%d)",
+            "fetched %d session(s) total from device (last_known_ts=%d)%s",
             len(all_sessions),
             self._last_session_ts,
+            "".join(lines),
         )
-        for i, s in enumerate(all_sessions):
-            ts = s.get(DATA_LAST_BRUSH_TIME, 0)
-            status = "NEW" if ts > self._last_session_ts else "known"
-            self._log.debug(
-                " session[%d]: ts=%d (%s)  %s",
-                i,
-                ts,
-                datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "n/a",
-                status,
-            )
 
     async def _read_device_info_service(self, client: BleakClient, collected: dict[str, Any]) -> None:
         """Read BLE Device Information Service (0x180A) characteristics.
@@ -1490,12 +1578,13 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
             )
         else:
             timestamp = int(time.time())
-            cal_cmd = CMD_CALIBRATE_TIME_PREFIX + struct.pack(">I", timestamp)
+            cal_cmd = _CALIBRATE_TIME_STRUCT.pack(CMD_CALIBRATE_TIME_PREFIX, timestamp)
             self._log.debug("time calibration sent (ts=%d)", timestamp)
-        try:
-            await client.write_gatt_char(self._protocol.write_char, cal_cmd, response=True)
-        except Exception as err:  # noqa: BLE001
-            self._log.warning("time calibration failed: %s (%s)", err, type(err).__name__)
+        await self._safe_gatt(
+            client.write_gatt_char(self._protocol.write_char, cal_cmd, response=True),
+            "time calibration",
+            warn=True,
+        )
 
     async def _subscribe_notifications(
         self, client: BleakClient, handler: Callable[[Any, bytearray], None]
@@ -1518,75 +1607,86 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         for char_uuid in self._protocol.notify_chars:
             await _clear_cccd(client, char_uuid)
 
+        # One characteristic at a time: the stale-CCCD retry (stop_notify → clear
+        # → sleep → start_notify) must not interleave with another subscribe,
+        # and BlueZ / ESPHome proxies reject overlapping GATT operations.
         subscribed: set[str] = set()
         for char_uuid in self._protocol.notify_chars:
-            try:
-                await asyncio.wait_for(
-                    client.start_notify(char_uuid, handler),
-                    timeout=BLE_SUBSCRIBE_FIRST_TIMEOUT,
-                )
+            if await self._subscribe_notification(client, char_uuid, handler):
                 subscribed.add(char_uuid)
-                self._log.debug("subscribed to %s", char_uuid)
-            except Exception as err:  # noqa: BLE001
-                is_timeout = isinstance(err, asyncio.TimeoutError)
-                is_stale = "Notify acquired" in str(err)
-                if is_timeout or is_stale:
-                    # Both TimeoutError and "Notify acquired" indicate a stale CCCD
-                    # state on the device.  Release the local handler, clear the CCCD
-                    # descriptor (write 0x0000) to force the device to accept a fresh
-                    # subscription, then retry with a longer timeout.
-                    if is_timeout:
-                        self._log.debug(
-                            "subscribe timeout on %s – clearing CCCD and retrying",
-                            char_uuid,
-                        )
-                    else:
-                        self._log.debug(
-                            "Notify acquired on %s – releasing stale subscription and retrying",
-                            char_uuid,
-                        )
-                    with contextlib.suppress(Exception):
-                        await client.stop_notify(char_uuid)
-                    await _clear_cccd(client, char_uuid)
-                    await asyncio.sleep(0.3)
-                    try:
-                        await asyncio.wait_for(
-                            client.start_notify(char_uuid, handler),
-                            timeout=BLE_SUBSCRIBE_RETRY_TIMEOUT,
-                        )
-                        subscribed.add(char_uuid)
-                        self._log.debug("subscribed to %s (after CCCD clear)", char_uuid)
-                    except Exception as retry_err:  # noqa: BLE001
-                        self._log.warning(
-                            "could not subscribe to %s after CCCD clear: %s"
-                            " – persistent stale BLE state detected."
-                            " Try: (1) close the Oclean app on your phone,"
-                            " (2) run 'systemctl restart bluetooth' on the host,"
-                            " (3) if the problem persists, factory-reset the toothbrush"
-                            " to clear its internal bond state",
-                            char_uuid,
-                            retry_err,
-                        )
-                else:
-                    is_no_cccd = "does not have a characteristic client config descriptor" in str(err)
-                    if is_no_cccd:
-                        self._log.debug("no CCCD on %s – trying no-CCCD subscribe path", char_uuid)
-                        if await _try_subscribe_no_cccd(
-                            client,
-                            char_uuid,
-                            handler,
-                            self._log,
-                        ):
-                            subscribed.add(char_uuid)
-                    else:
-                        self._log.debug(
-                            "could not subscribe to %s: %s (%s)",
-                            char_uuid,
-                            err,
-                            type(err).__name__,
-                        )
         return frozenset(subscribed)
 
+    async def _subscribe_notification(
+        self, client: BleakClient, char_uuid: str, handler: Callable[[Any, bytearray], None]
+    ) -> bool:
+        """Subscribe to one notification characteristic; return True on success."""
+        try:
+            await asyncio.wait_for(
+                client.start_notify(char_uuid, handler),
+                timeout=BLE_SUBSCRIBE_FIRST_TIMEOUT,
+            )
+            self._log.debug("subscribed to %s", char_uuid)
+            return True
+        except Exception as err:  # noqa: BLE001
+            is_timeout = isinstance(err, asyncio.TimeoutError)
+            is_stale = "Notify acquired" in str(err)
+            if is_timeout or is_stale:
+                # Both TimeoutError and "Notify acquired" indicate a stale CCCD
+                # state on the device.  Release the local handler, clear the CCCD
+                # descriptor (write 0x0000) to force the device to accept a fresh
+                # subscription, then retry with a longer timeout.
+                if is_timeout:
+                    self._log.debug(
+                        "subscribe timeout on %s – clearing CCCD and retrying",
+                        char_uuid,
+                    )
+                else:
+                    self._log.debug(
+                        "Notify acquired on %s – releasing stale subscription and retrying",
+                        char_uuid,
+                    )
+                with contextlib.suppress(Exception):
+                    await client.stop_notify(char_uuid)
+                await _clear_cccd(client, char_uuid)
+                await asyncio.sleep(0.3)
+                try:
+                    await asyncio.wait_for(
+                        client.start_notify(char_uuid, handler),
+                        timeout=BLE_SUBSCRIBE_RETRY_TIMEOUT,
+                    )
+                    self._log.debug("subscribed to %s (after CCCD clear)", char_uuid)
+                    return True
+                except Exception as retry_err:  # noqa: BLE001
+                    self._log.warning(
+                        "could not subscribe to %s after CCCD clear: %s"
+                        " – persistent stale BLE state detected."
+                        " Try: (1) close the Oclean app on your phone,"
+                        " (2) run 'systemctl restart bluetooth' on the host,"
+                        " (3) if the problem persists, factory-reset the toothbrush"
+                        " to clear its internal bond state",
+                        char_uuid,
+                        retry_err,
+                    )
+            else:
+                is_no_cccd = "does not have a characteristic client config descriptor" in str(err)
+                if is_no_cccd:
+                    self._log.debug("no CCCD on %s – trying no-CCCD subscribe path", char_uuid)
+                    if await _try_subscribe_no_cccd(
+                        client,
+                        char_uuid,
+                        handler,
+                        self._log,
+                    ):
+                        return True
+                else:
+                    self._log.debug(
+                        "could not subscribe to %s: %s (%s)",
+                        char_uuid,
+                        err,
+                        type(err).__name__,
+                    )
+        return False
+
     async def _read_response_char_fallback(
         self, client: BleakClient, handler: Callable[[Any, bytearray], None]
     ) -> None:
@@ -1689,8 +1789,15 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
                         hex86,
                     )
                     handler(None, bytearray(data86))
-            except Exception:  # noqa: BLE001
-                pass  # fbb86 READ failures are expected on some devices
+            except Exception as err:  # noqa: BLE001
+                # fbb86 READ failures are expected on some devices, hence DEBUG level
+                self._log.debug(
+                    "poll fallback fbb86 [%d/%d] failed: %s (%s)",
+                    attempt + 1,
+                    BLE_POLL_FALLBACK_ATTEMPTS,
+                    err,
+                    type(err).__name__,
+                )
 
     async def _send_query_commands(
         self,
@@ -1707,20 +1814,20 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         *notify_wait* overrides the default notification timeout (used when
         subscriptions failed and a polling fallback will follow).
         """
+        # cmd.hex() is only worth building when the debug lines are emitted
+        debug = self._log.isEnabledFor(logging.DEBUG)
         for char_uuid, cmd in self._protocol.query_commands:
             try:
                 await asyncio.wait_for(
                     client.write_gatt_char(char_uuid, cmd, response=True),
                     timeout=BLE_WRITE_TIMEOUT,
                 )
-                self._log.debug("command 0x%s sent to ...%s", cmd.hex(), char_uuid[-8:])
             except Exception as err:  # noqa: BLE001
-                self._log.debug(
-                    "command 0x%s skipped: %s (%s)",
-                    cmd.hex(),
-                    err,
-                    type(err).__name__,
-                )
+                if debug:
+                    self._log.debug("command 0x%s skipped: %s (%s)", cmd.hex(), err, type(err).__name__)
+                continue
+            if debug:
+                self._log.debug("command 0x%s sent to ...%s", cmd.hex(), char_uuid[-8:])
 
         wait = notify_wait if notify_wait is not None else float(BLE_NOTIFICATION_WAIT)
         # Wait for first session notification (or timeout if device has no records)
@@ -1819,11 +1926,12 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
                 self._log.debug("battery notify subscribe failed: %s (%s)", err, type(err).__name__)
 
     async def _read_battery_and_unsubscribe(self, client: BleakClient, collected: dict[str, Any]) -> None:
-        """Read battery level via GATT, unless a notification already delivered it.
+        """Read battery level via GATT, unless the poll already delivered it.
 
-        If _subscribe_battery_notifications captured a 0x2A19 push during the poll
-        window, DATA_BATTERY is already in *collected* and the explicit read is
-        skipped.  The read_gatt_char fallback covers devices that support the
+        If the post-connect readiness probe read 0x2A19, or
+        _subscribe_battery_notifications captured a push during the poll window,
+        DATA_BATTERY is already in *collected* and the explicit read is skipped.
+        The read_gatt_char fallback covers devices that support the
         characteristic but do not push notifications proactively.
 
         stop_notify is intentionally omitted: the BLE disconnect in _poll_device's
@@ -1832,13 +1940,13 @@ class OcleanCoordinator(DataUpdateCoordinator[OcleanDeviceData]):
         """
         self._log.debug("poll collected so far: %s", collected)
         if DATA_BATTERY in collected:
-            self._log.debug("battery already set from notification: %d%%", collected[DATA_BATTERY])
+            self._log.debug("battery already set during poll: %d%%", collected[DATA_BATTERY])
             return
-        try:
-            batt_raw = await client.read_gatt_char(BATTERY_CHAR_UUID)
-            self._log.debug("battery raw: %s", bytes(batt_raw).hex())
-            batt = parse_battery(bytes(batt_raw))
-            if batt is not None:
-                collected[DATA_BATTERY] = batt
-        except Exception as err:  # noqa: BLE001
-            self._log.warning("battery read failed: %s (%s)", err, type(err).__name__)
+        batt_raw = await self._safe_gatt(client.read_gatt_char(BATTERY_CHAR_UUID), "battery read", warn=True)
+        if batt_raw is None:
+            return
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("battery raw: %s", batt_raw.hex())
+        batt = parse_battery(bytes(batt_raw))
+        if batt is not None:
+            collected[DATA_BATTERY] = batt
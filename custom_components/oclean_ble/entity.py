@@ -53,10 +53,10 @@ class OcleanEntity(CoordinatorEntity[OcleanCoordinator]):
         indicating structural unavailability on this device.
         Falls back to stale-data availability when the last poll failed.
         """
-        if not self.coordinator.last_update_success:
-            return value is not None
-        return not (
-            self.coordinator.data is not None
-            and self.coordinator.data.get(DATA_LAST_BRUSH_TIME) is not None
-            and value is None
-        )
+        if value is not None:
+            return True
+        coordinator = self.coordinator
+        if not coordinator.last_update_success:
+            return False
+        data = coordinator.data
+        return data is None or data.get(DATA_LAST_BRUSH_TIME) is None
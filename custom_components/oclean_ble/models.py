@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class OcleanDeviceData:
     """Typed value object representing one coordinator data snapshot.
 
@@ -52,26 +52,12 @@ class OcleanDeviceData:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> OcleanDeviceData:
-        """Construct an instance from the raw dict produced by the coordinator."""
-        return cls(
-            battery=data.get("battery"),
-            last_brush_score=data.get("last_brush_score"),
-            last_brush_duration=data.get("last_brush_duration"),
-            last_brush_pressure=data.get("last_brush_pressure"),
-            last_brush_time=data.get("last_brush_time"),
-            brush_head_usage=data.get("brush_head_usage"),
-            brush_head_days=data.get("brush_head_days"),
-            last_brush_areas=data.get("last_brush_areas"),
-            last_brush_coverage=data.get("last_brush_coverage"),
-            last_brush_pnum=data.get("last_brush_pnum"),
-            brush_mode=data.get("brush_mode"),
-            model_id=data.get("model_id"),
-            hw_revision=data.get("hw_revision"),
-            sw_version=data.get("sw_version"),
-            last_brush_gesture_code=data.get("last_brush_gesture_code"),
-            last_brush_pressure_ratio=data.get("last_brush_pressure_ratio"),
-            last_brush_pressure_code=data.get("last_brush_pressure_code"),
-            last_brush_gesture_array=data.get("last_brush_gesture_array"),
-            last_brush_power_array=data.get("last_brush_power_array"),
-            last_poll=data.get("last_poll"),
-        )
+        """Construct an instance from the raw dict produced by the coordinator.
+
+        Missing keys become None, the default of every field.
+        """
+        return cls(**{name: data.get(name) for name in _FIELD_NAMES})
+
+
+# Field names in declaration order; computed once for from_dict()
+_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(OcleanDeviceData))
@@ -36,7 +36,9 @@ async def async_setup_entry(
     coordinator: OcleanCoordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC_ADDRESS]
     device_name = entry.data.get(CONF_DEVICE_NAME, "Oclean")
-    async_add_entities(OcleanNumber(coordinator, description, mac, device_name) for description in NUMBER_DESCRIPTIONS)
+    async_add_entities(
+        [OcleanNumber(coordinator, description, mac, device_name) for description in NUMBER_DESCRIPTIONS]
+    )
 
 
 class OcleanNumber(OcleanEntity, NumberEntity):
@@ -68,3 +70,4 @@ class OcleanNumber(OcleanEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         if self.entity_description.key == "brush_head_max_days":
             await self.coordinator.async_set_brush_head_max_days(int(value))
+            self.async_write_ha_state()
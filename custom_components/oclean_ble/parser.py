@@ -226,6 +226,9 @@ def parse_notification(data: bytes) -> dict[str, Any]:
     Dispatches to the appropriate handler via the ``_PARSERS`` registry
     (Strategy pattern). Unknown data is logged as hex for empirical
     analysis during testing.
+
+    Always returns a new dict that the caller owns (the coordinator stores it
+    in its session list without copying).
     """
     if len(data) < 2:
         _LOGGER.debug("Oclean notification too short: %s", data.hex())
@@ -351,7 +354,8 @@ def _parse_state_response(payload: bytes) -> dict[str, Any]:
         if 0 <= batt <= 100:
             result[DATA_BATTERY] = batt
 
-    _LOGGER.debug("Oclean STATE parsed: %s (raw: %s)", result, payload.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Oclean STATE parsed: %s (raw: %s)", result, payload.hex())
 
     # Log unknown bytes to help identify their purpose over time.
     # Enable via:  logger: logs: custom_components.oclean_ble: debug
@@ -385,7 +389,8 @@ def _parse_info_response(payload: bytes) -> dict[str, Any]:
       Identified by: payload[0] >= 1 (year-2000 for any date from 2001 onward).
       Contains: timestamp, tz offset, week, pNum, blunt-teeth count, pressure raw.
     """
-    _LOGGER.debug("Oclean INFO response raw payload: %s", payload.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Oclean INFO response raw payload: %s", payload.hex())
 
     # Extended format: byte 0 is the high byte of a BE uint16 record-length field.
     # For BLE payloads (MTU < 256 bytes) this is always 0; byte 1 is the actual length.
@@ -866,7 +871,8 @@ def _parse_info_t1_response(payload: bytes) -> dict[str, Any]:
     APK source: AbstractC0002b.m18f / C3385w0_fallback.java / C5733b.m8524e
     (DeviceType OCLEANY3M, protocol 14, i12=1).
     """
-    _LOGGER.debug("Oclean Type-1 INFO response raw: %s", payload.hex())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Oclean Type-1 INFO response raw: %s", payload.hex())
 
     if len(payload) < _T1_MIN_SIZE:
         _LOGGER.debug("Oclean Type-1 INFO: payload too short (%d bytes)", len(payload))
@@ -1231,15 +1237,16 @@ def _parse_session_meta_t1_response(payload: bytes) -> dict[str, Any]:
         )
         timestamp_s = int(time.mktime(device_dt.timetuple()))
         duration = payload[15]
-        _LOGGER.debug(
-            "Oclean 5a00 session: date=%s ts=%d duration=%ds b13=0x%02x b16=0x%02x (raw: %s)",
-            device_dt.strftime("%Y-%m-%d %H:%M:%S"),
-            timestamp_s,
-            duration,
-            payload[13],
-            payload[16],
-            payload.hex(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Oclean 5a00 session: date=%s ts=%d duration=%ds b13=0x%02x b16=0x%02x (raw: %s)",
+                device_dt.strftime("%Y-%m-%d %H:%M:%S"),
+                timestamp_s,
+                duration,
+                payload[13],
+                payload[16],
+                payload.hex(),
+            )
         result: dict[str, Any] = {DATA_LAST_BRUSH_TIME: timestamp_s}
         if duration > 0 and duration != 0xFF:
             result[DATA_LAST_BRUSH_DURATION] = duration
@@ -1468,14 +1475,15 @@ def _parse_session_meta_y3p_response(payload: bytes) -> dict[str, Any]:
         timestamp_s = int(time.mktime(device_dt.timetuple()))
         duration = payload[15]
 
-        _LOGGER.debug(
-            "Oclean 5100 session: date=%s ts=%d duration=%ds b7=0x%02x (raw: %s)",
-            device_dt.strftime("%Y-%m-%d %H:%M:%S"),
-            timestamp_s,
-            duration,
-            payload[7],
-            payload.hex(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Oclean 5100 session: date=%s ts=%d duration=%ds b7=0x%02x (raw: %s)",
+                device_dt.strftime("%Y-%m-%d %H:%M:%S"),
+                timestamp_s,
+                duration,
+                payload[7],
+                payload.hex(),
+            )
         result: dict[str, Any] = {DATA_LAST_BRUSH_TIME: timestamp_s}
         if duration > 0 and duration != 0xFF:
             result[DATA_LAST_BRUSH_DURATION] = duration
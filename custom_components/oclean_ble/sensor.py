@@ -344,7 +344,8 @@ class OcleanSchemeSensor(OcleanEntity, SensorEntity):
         pnum = self._get_pnum()
         if pnum is None:
             return None
-        return SCHEME_NAMES.get(pnum, str(pnum))
+        name = SCHEME_NAMES.get(pnum)
+        return name if name is not None else str(pnum)
 
     @property
     def available(self) -> bool:
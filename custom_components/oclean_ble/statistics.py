@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 from .const import (
@@ -28,11 +30,13 @@ _STAT_METRICS: tuple[tuple[str, str, str | None], ...] = (
 )
 
 
+@functools.cache
 def _load_recorder_api():
     """Load recorder statistics API lazily (absent on some HA setups).
 
     Returns (StatisticData, StatisticMetaData, async_add_external_statistics)
-    or None if the recorder component is unavailable.
+    or None if the recorder component is unavailable.  The lookup runs once per
+    HA session; later polls reuse the cached result.
     """
     try:
         from homeassistant.components.recorder.statistics import (
@@ -53,6 +57,20 @@ def _load_recorder_api():
         return None
 
 
+def _hour_start(ts: int) -> datetime.datetime:
+    """Return the UTC start of the hour containing unix timestamp *ts*."""
+    return datetime.datetime.fromtimestamp(ts - ts % 3600, tz=datetime.UTC)
+
+
+@functools.cache
+def _statistic_labels(mac_slug: str, device_name: str, suffix: str) -> tuple[str, str]:
+    """Return (name, statistic_id) for one statistic; fixed per device, so cached."""
+    return (
+        f"Oclean {device_name} {suffix.replace('_', ' ').title()}",
+        f"{DOMAIN}:{mac_slug}_{suffix}",
+    )
+
+
 async def import_new_sessions(
     hass: HomeAssistant,
     mac_slug: str,
@@ -68,47 +86,56 @@ async def import_new_sessions(
 
     Returns the updated last_session_ts (unchanged when no new sessions exist).
     """
-    new_sessions = [s for s in sessions if s.get("last_brush_time", 0) > last_session_ts]
-    if not new_sessions:
-        _LOGGER.debug("Oclean no new sessions to import into statistics")
-        return last_session_ts
-
-    _LOGGER.debug("Oclean importing %d new session(s) into HA statistics:", len(new_sessions))
-    for s in new_sessions:
-        ts = s.get("last_brush_time", 0)
-        _LOGGER.debug(
-            "Oclean  → import ts=%d (%s)",
-            ts,
-            datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "n/a",
-        )
-
     recorder_api = _load_recorder_api()
     if recorder_api is None:
         _LOGGER.debug("Oclean recorder statistics API not available; skipping history import")
         return last_session_ts
     StatisticData, StatisticMetaData, async_add_external_statistics = recorder_api
 
-    from homeassistant.util import dt as dt_util
+    # (session, timestamp) pairs: the timestamp is read from each dict only once
+    new_sessions = [(s, ts) for s in sessions if (ts := s.get("last_brush_time", 0)) > last_session_ts]
+    if not new_sessions:
+        _LOGGER.debug("Oclean no new sessions to import into statistics")
+        return last_session_ts
 
-    for data_key, stat_suffix, unit in _STAT_METRICS:
-        stat_rows: list[Any] = []
-        for session in new_sessions:
+    _LOGGER.debug("Oclean importing %d new session(s) into HA statistics:", len(new_sessions))
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for _session, ts in new_sessions:
+            _LOGGER.debug(
+                "Oclean  → import ts=%d (%s)",
+                ts,
+                datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+
+    # Single pass over the sessions: each session dict is visited once and its
+    # hour bucket computed once, feeding the metric and per-zone area rows.
+    metric_rows: dict[str, list[Any]] = {data_key: [] for data_key, _suffix, _unit in _STAT_METRICS}
+    area_stats_by_zone: defaultdict[str, list[Any]] = defaultdict(list)
+    for session, ts in new_sessions:
+        start_dt = _hour_start(ts)
+        for data_key, rows in metric_rows.items():
             value = session.get(data_key)
-            if value is None:
-                continue
-            ts = session["last_brush_time"]
-            start_dt = datetime.datetime.fromtimestamp(ts, tz=dt_util.UTC).replace(minute=0, second=0, microsecond=0)
-            stat_rows.append(StatisticData(start=start_dt, mean=float(value), state=float(value)))
+            if value is not None:
+                mean = float(value)
+                rows.append(StatisticData(start=start_dt, mean=mean, state=mean))
+        areas = session.get(DATA_LAST_BRUSH_AREAS)
+        if isinstance(areas, dict):
+            for zone_name, pressure in areas.items():
+                mean = float(pressure)
+                area_stats_by_zone[zone_name].append(StatisticData(start=start_dt, mean=mean, state=mean))
 
+    for data_key, stat_suffix, unit in _STAT_METRICS:
+        stat_rows = metric_rows[data_key]
         if not stat_rows:
             continue
 
+        name, statistic_id = _statistic_labels(mac_slug, device_name, stat_suffix)
         metadata = StatisticMetaData(
             has_mean=True,
             has_sum=False,
-            name=f"Oclean {device_name} {stat_suffix.replace('_', ' ').title()}",
+            name=name,
             source=DOMAIN,
-            statistic_id=f"{DOMAIN}:{mac_slug}_{stat_suffix}",
+            statistic_id=statistic_id,
             unit_of_measurement=unit,
         )
         try:
@@ -130,25 +157,14 @@ async def import_new_sessions(
         )
 
     # Per-zone area pressures as individual statistics
-    area_stats_by_zone: dict[str, list[Any]] = {}
-    for session in new_sessions:
-        areas = session.get(DATA_LAST_BRUSH_AREAS)
-        if not isinstance(areas, dict):
-            continue
-        ts = session["last_brush_time"]
-        start_dt = datetime.datetime.fromtimestamp(ts, tz=dt_util.UTC).replace(minute=0, second=0, microsecond=0)
-        for zone_name, pressure in areas.items():
-            area_stats_by_zone.setdefault(zone_name, []).append(
-                StatisticData(start=start_dt, mean=float(pressure), state=float(pressure))
-            )
-
     for zone_name, stat_rows in area_stats_by_zone.items():
+        name, statistic_id = _statistic_labels(mac_slug, device_name, f"area_{zone_name}")
         metadata = StatisticMetaData(
             has_mean=True,
             has_sum=False,
-            name=f"Oclean {device_name} Area {zone_name.replace('_', ' ').title()}",
+            name=name,
             source=DOMAIN,
-            statistic_id=f"{DOMAIN}:{mac_slug}_area_{zone_name}",
+            statistic_id=statistic_id,
             unit_of_measurement=None,
         )
         try:
@@ -168,5 +184,5 @@ async def import_new_sessions(
             zone_name,
         )
 
-    max_ts = max(s.get("last_brush_time", 0) for s in new_sessions)
-    return max_ts if max_ts > last_session_ts else last_session_ts
+    # Every timestamp in new_sessions is > last_session_ts by construction
+    return max(ts for _session, ts in new_sessions)
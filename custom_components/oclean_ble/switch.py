@@ -46,7 +46,9 @@ async def async_setup_entry(
     coordinator: OcleanCoordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC_ADDRESS]
     device_name = entry.data.get(CONF_DEVICE_NAME, "Oclean")
-    async_add_entities(OcleanSwitch(coordinator, description, mac, device_name) for description in SWITCH_DESCRIPTIONS)
+    async_add_entities(
+        [OcleanSwitch(coordinator, description, mac, device_name) for description in SWITCH_DESCRIPTIONS]
+    )
 
 
 class OcleanSwitch(OcleanEntity, SwitchEntity):
@@ -92,8 +94,10 @@ class OcleanSwitch(OcleanEntity, SwitchEntity):
         setter = self._KEY_TO_SETTER.get(self.entity_description.key)
         if setter:
             await getattr(self.coordinator, setter)(True)
+            self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         setter = self._KEY_TO_SETTER.get(self.entity_description.key)
         if setter:
             await getattr(self.coordinator, setter)(False)
+            self.async_write_ha_state()
@@ -42,6 +42,7 @@ def _install_ha_stubs() -> None:
     core = _stub("homeassistant.core")
     core.HomeAssistant = MagicMock
     core.ServiceCall = MagicMock
+    core.Event = MagicMock
     core.callback = lambda f: f
 
     # ---- homeassistant.const ----
@@ -49,6 +50,7 @@ def _install_ha_stubs() -> None:
 
     const = _stub("homeassistant.const")
     const.__version__ = "2025.1.0"
+    const.EVENT_HOMEASSISTANT_STOP = "homeassistant_stop"
     const.Platform = Enum("Platform", ["SENSOR", "BINARY_SENSOR", "BUTTON", "NUMBER", "SELECT", "SWITCH"])
     const.PERCENTAGE = "%"
 
@@ -98,6 +100,9 @@ def _install_ha_stubs() -> None:
         def __init_subclass__(cls, *, domain=None, **kwargs):
             super().__init_subclass__(**kwargs)
 
+        def _async_current_ids(self, include_ignore=True):
+            return set()
+
     class _OptionsFlow:
         config_entry = None  # injected by HA; accessed via self.config_entry
 
@@ -156,8 +161,9 @@ def _install_ha_stubs() -> None:
         pass
 
     class DataUpdateCoordinator:
-        def __init__(self, hass, logger, *, name, update_interval):
+        def __init__(self, hass, logger, *, config_entry=None, name, update_interval, always_update=True):
             self.hass = hass
+            self.config_entry = config_entry
             self.data = None
             self.last_update_success = True
             self.update_interval = update_interval
@@ -198,6 +204,9 @@ def _install_ha_stubs() -> None:
         async def async_save(self, data):
             pass
 
+        def async_delay_save(self, data_func, delay=0):
+            pass
+
     storage.Store = _StoreStub
 
     # ---- homeassistant.helpers.device_registry ----
@@ -309,7 +318,8 @@ def _install_ha_stubs() -> None:
             self.icon = icon
 
     class SwitchEntity:
-        pass
+        def async_write_ha_state(self) -> None:
+            pass
 
     sw.SwitchEntityDescription = SwitchEntityDescription
     sw.SwitchEntity = SwitchEntity
@@ -363,7 +373,8 @@ def _install_ha_stubs() -> None:
             self.entity_category = entity_category
 
     class NumberEntity:
-        pass
+        def async_write_ha_state(self) -> None:
+            pass
 
     num.NumberMode = NumberMode
     num.NumberEntityDescription = NumberEntityDescription
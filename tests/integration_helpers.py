@@ -16,7 +16,7 @@ def make_coordinator(mac: str, name: str) -> OcleanCoordinator:
     """Create a minimal OcleanCoordinator with HA storage pre-loaded."""
     hass = MagicMock()
     hass.data = {}
-    coord = OcleanCoordinator(hass, mac, name, 300)
+    coord = OcleanCoordinator(hass, None, mac, name, 300)
     coord._store_loaded = True
     return coord
 
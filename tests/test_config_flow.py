@@ -16,6 +16,7 @@ from custom_components.oclean_ble.config_flow import (
     _windows_list_to_str,
 )
 from custom_components.oclean_ble.const import (
+    CONF_FILE_LOG_LEVEL,
     CONF_MAC_ADDRESS,
     CONF_POLL_INTERVAL,
     CONF_POLL_WINDOWS,
@@ -49,15 +50,18 @@ class TestMacAddressRegex:
         "",
         "AA:BB:CC:DD:EE:GG",
         "AA:BB:CC:DD:EE:F",  # too short last octet
+        "AA:BB:CC:DD:EE:FF ",  # trailing whitespace (stripped by the flow, not here)
+        "AA:BB:CC:DD:EE:F\u00e9",  # non-ASCII
+        "AA:BB:CC:DD:EE:F:",  # colon in a hex position
     ]
 
     @pytest.mark.parametrize("mac", VALID)
     def test_valid_macs(self, mac):
-        assert _MAC_RE.match(mac), f"Expected {mac!r} to be valid"
+        assert _MAC_RE.fullmatch(mac), f"Expected {mac!r} to be valid"
 
     @pytest.mark.parametrize("mac", INVALID)
     def test_invalid_macs(self, mac):
-        assert not _MAC_RE.match(mac), f"Expected {mac!r} to be invalid"
+        assert not _MAC_RE.fullmatch(mac), f"Expected {mac!r} to be invalid"
 
 
 # ---------------------------------------------------------------------------
@@ -82,22 +86,35 @@ class TestPollIntervalConstants:
 
 
 class TestMacNormalization:
-    """The config flow calls .upper().strip() on the MAC before validation."""
+    """The config flow strips the MAC, validates it, then upper-cases it."""
 
-    def test_lowercase_mac_normalizes(self):
-        raw = "aa:bb:cc:dd:ee:ff"
-        normalized = raw.upper().strip()
-        assert _MAC_RE.match(normalized)
+    def _make_flow(self) -> OcleanConfigFlow:
+        flow = OcleanConfigFlow()
+        flow.async_create_entry = MagicMock(return_value={"type": "create_entry"})
+        flow.async_show_form = MagicMock(return_value={"type": "form"})
+        flow.async_set_unique_id = AsyncMock()
+        flow._abort_if_unique_id_configured = MagicMock()
+        return flow
 
-    def test_whitespace_stripped(self):
-        raw = "  AA:BB:CC:DD:EE:FF  "
-        normalized = raw.upper().strip()
-        assert _MAC_RE.match(normalized)
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "aa:bb:cc:dd:ee:ff",  # lowercase
+            "  AA:BB:CC:DD:EE:FF  ",  # surrounding whitespace
+            "Aa:Bb:Cc:Dd:Ee:Ff",  # mixed case
+        ],
+    )
+    def test_manual_stores_uppercase_mac(self, raw):
+        flow = self._make_flow()
+        asyncio.run(flow.async_step_manual({CONF_MAC_ADDRESS: raw}))
+        flow.async_set_unique_id.assert_awaited_once_with("AA:BB:CC:DD:EE:FF")
+        assert flow.async_create_entry.call_args.kwargs["data"][CONF_MAC_ADDRESS] == "AA:BB:CC:DD:EE:FF"
 
-    def test_mixed_case_normalizes(self):
-        raw = "Aa:Bb:Cc:Dd:Ee:Ff"
-        normalized = raw.upper().strip()
-        assert _MAC_RE.match(normalized)
+    def test_manual_rejects_trailing_garbage(self):
+        flow = self._make_flow()
+        asyncio.run(flow.async_step_manual({CONF_MAC_ADDRESS: "AA:BB:CC:DD:EE:FF:00"}))
+        flow.async_create_entry.assert_not_called()
+        assert flow.async_show_form.call_args.kwargs["errors"] == {CONF_MAC_ADDRESS: "invalid_mac"}
 
 
 # ---------------------------------------------------------------------------
@@ -131,6 +148,9 @@ class TestParseWindowsList:
     def test_whitespace_tolerant(self):
         assert _parse_windows_list("  07:00 - 09:00  ") == [("07:00:00", "09:00:00")]
 
+    def test_trailing_garbage_rejected(self):
+        assert _parse_windows_list("07:00-09:00x, 20:00-22:30") == [("20:00:00", "22:30:00")]
+
 
 class TestWindowsListToStr:
     def test_empty_list(self):
@@ -211,6 +231,16 @@ class TestPollIntervalGapValidationInFlowSteps:
         else:
             flow.async_create_entry.assert_called_once()
 
+    def test_static_schemas_reused_between_renders(self):
+        flow = self._make_flow()
+        asyncio.run(flow.async_step_confirm(None))
+        asyncio.run(flow.async_step_manual(None))
+        asyncio.run(flow.async_step_confirm(None))
+        asyncio.run(flow.async_step_manual(None))
+        schemas = [c.kwargs["data_schema"] for c in flow.async_show_form.call_args_list]
+        assert schemas[0] is schemas[2]
+        assert schemas[1] is schemas[3]
+
     def test_confirm_stores_integer_not_float(self):
         """NumberSelector returns floats – verify the int() cast stores an int."""
         flow = self._make_flow()
@@ -290,6 +320,20 @@ class TestOcleanOptionsFlow:
         assert data[CONF_POLL_INTERVAL] == 300
         assert data[CONF_POST_BRUSH_COOLDOWN] == 2
         assert data[CONF_POLL_WINDOWS] == ""
+        assert data[CONF_FILE_LOG_LEVEL] == "INFO"
+
+    def test_init_stores_file_log_level(self):
+        flow = self._make_flow()
+        asyncio.run(
+            flow.async_step_init(
+                {
+                    CONF_POLL_INTERVAL: 300,
+                    CONF_FILE_LOG_LEVEL: "DEBUG",
+                    CONF_WINDOW_COUNT: 0,
+                }
+            )
+        )
+        assert flow.async_create_entry.call_args.kwargs["data"][CONF_FILE_LOG_LEVEL] == "DEBUG"
 
     def test_init_invalid_poll_interval_shows_error(self):
         flow = self._make_flow()
@@ -388,6 +432,22 @@ class TestOcleanOptionsFlow:
         flow.async_show_form.assert_called_once()
         assert flow.async_show_form.call_args.kwargs["step_id"] == "window_1"
 
+    def test_window_step_without_existing_window_uses_shared_schema(self):
+        from custom_components.oclean_ble.config_flow import _WINDOW_SCHEMA
+
+        flow = self._make_flow()
+        flow._existing_windows = [("07:00:00", "09:00:00")]
+        asyncio.run(flow._async_step_window(2, None))
+        assert flow.async_show_form.call_args.kwargs["data_schema"] is _WINDOW_SCHEMA
+
+    def test_window_step_prefills_existing_window(self):
+        flow = self._make_flow()
+        flow._existing_windows = [("07:00:00", "09:00:00")]
+        asyncio.run(flow._async_step_window(1, None))
+        schema = flow.async_show_form.call_args.kwargs["data_schema"]
+        defaults = {str(key): key.default() for key in schema.schema}
+        assert defaults == {CONF_WINDOW_START: "07:00:00", CONF_WINDOW_END: "09:00:00"}
+
     def test_window_delegates(self):
         """async_step_window_1/2/3 delegate to _async_step_window."""
         flow = self._make_flow()
@@ -413,7 +473,6 @@ class TestOcleanOptionsFlow:
         flow._window_count = 2
         flow._collected_windows = []
         flow._existing_windows = []
-        flow.async_step_window_2 = AsyncMock(return_value={"type": "form"})
         asyncio.run(
             flow._async_step_window(
                 1,
@@ -423,7 +482,7 @@ class TestOcleanOptionsFlow:
                 },
             )
         )
-        flow.async_step_window_2.assert_called_once()
+        assert flow.async_show_form.call_args.kwargs["step_id"] == "window_2"
         flow.async_create_entry.assert_not_called()
 
 
@@ -478,6 +537,14 @@ class TestPickDeviceStep:
         flow.async_show_form.assert_called_once()
         assert flow.async_show_form.call_args.kwargs["step_id"] == "pick_device"
 
+    def test_pick_device_options_built_once(self):
+        flow = self._make_flow()
+        asyncio.run(flow.async_step_pick_device(None))
+        first_options = flow._device_options
+        asyncio.run(flow.async_step_pick_device({CONF_MAC_ADDRESS: "AA:BB:CC:DD:EE:FF", CONF_POLL_INTERVAL: 30}))
+        assert first_options == {"AA:BB:CC:DD:EE:FF": "Oclean X (AA:BB:CC:DD:EE:FF)"}
+        assert flow._device_options is first_options
+
 
 # ---------------------------------------------------------------------------
 # Bluetooth step (lines 93-100)
@@ -563,3 +630,87 @@ class TestUserStepWithDiscovery:
             flow.async_step_manual.assert_not_called()
         finally:
             cf_module.bluetooth.async_discovered_service_info = original_fn
+
+    def test_user_step_matches_uuid_case_insensitively_and_skips_others(self):
+        flow = OcleanConfigFlow()
+        flow.hass = MagicMock()
+
+        from custom_components.oclean_ble import config_flow as cf_module
+        from custom_components.oclean_ble.const import OCLEAN_SERVICE_UUID
+
+        oclean_info = MagicMock()
+        oclean_info.service_uuids = ["0000180f-0000-1000-8000-00805f9b34fb", OCLEAN_SERVICE_UUID.upper()]
+        oclean_info.address = "AA:BB:CC:DD:EE:FF"
+        oclean_info.name = None
+        other_info = MagicMock()
+        other_info.service_uuids = ["0000180f-0000-1000-8000-00805f9b34fb"]
+        other_info.address = "11:22:33:44:55:66"
+
+        flow.async_step_pick_device = AsyncMock(return_value={"type": "form"})
+
+        original_fn = cf_module.bluetooth.async_discovered_service_info
+        cf_module.bluetooth.async_discovered_service_info = MagicMock(return_value=[oclean_info, other_info])
+        try:
+            asyncio.run(flow.async_step_user(None))
+            assert flow._discovered_devices == {"AA:BB:CC:DD:EE:FF": "AA:BB:CC:DD:EE:FF"}
+        finally:
+            cf_module.bluetooth.async_discovered_service_info = original_fn
+
+    def _run_user_step(self, flow, infos):
+        from custom_components.oclean_ble import config_flow as cf_module
+
+        flow.async_step_pick_device = AsyncMock(return_value={"type": "form"})
+        flow.async_step_manual = AsyncMock(return_value={"type": "form"})
+        original_fn = cf_module.bluetooth.async_discovered_service_info
+        cf_module.bluetooth.async_discovered_service_info = MagicMock(return_value=infos)
+        try:
+            asyncio.run(flow.async_step_user(None))
+        finally:
+            cf_module.bluetooth.async_discovered_service_info = original_fn
+
+    def _oclean_info(self, address):
+        from custom_components.oclean_ble.const import OCLEAN_SERVICE_UUID
+
+        info = MagicMock()
+        info.service_uuids = [OCLEAN_SERVICE_UUID]
+        info.address = address
+        info.name = "Oclean X"
+        return info
+
+    def test_user_step_skips_configured_devices(self):
+        flow = OcleanConfigFlow()
+        flow.hass = MagicMock()
+        flow._async_current_ids = MagicMock(return_value={"AA:BB:CC:DD:EE:FF"})
+
+        self._run_user_step(flow, [self._oclean_info("AA:BB:CC:DD:EE:FF")])
+
+        assert flow._discovered_devices == {}
+        flow.async_step_manual.assert_called_once()
+
+    def test_user_step_caps_discovered_devices(self):
+        from custom_components.oclean_ble.config_flow import _MAX_DISCOVERED_DEVICES
+
+        flow = OcleanConfigFlow()
+        flow.hass = MagicMock()
+        infos = [self._oclean_info(f"AA:BB:CC:DD:EE:{i:02X}") for i in range(_MAX_DISCOVERED_DEVICES + 5)]
+
+        self._run_user_step(flow, infos)
+
+        assert len(flow._discovered_devices) == _MAX_DISCOVERED_DEVICES
+
+    def test_user_step_reuses_devices_found_earlier_in_flow(self):
+        from custom_components.oclean_ble import config_flow as cf_module
+
+        flow = OcleanConfigFlow()
+        flow.hass = MagicMock()
+        flow._discovered_devices = {"AA:BB:CC:DD:EE:FF": "Oclean X"}
+        flow.async_step_pick_device = AsyncMock(return_value={"type": "form"})
+
+        original_fn = cf_module.bluetooth.async_discovered_service_info
+        cf_module.bluetooth.async_discovered_service_info = MagicMock(return_value=[])
+        try:
+            asyncio.run(flow.async_step_user(None))
+            cf_module.bluetooth.async_discovered_service_info.assert_not_called()
+            flow.async_step_pick_device.assert_called_once()
+        finally:
+            cf_module.bluetooth.async_discovered_service_info = original_fn
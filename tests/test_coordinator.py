@@ -17,6 +17,7 @@ from custom_components.oclean_ble.const import (
     DATA_LAST_BRUSH_TIME,
     DATA_MODEL_ID,
     DATA_SW_VERSION,
+    STORAGE_SAVE_DELAY,
 )
 
 # conftest.py stubs HA + bleak before these imports
@@ -25,6 +26,7 @@ from custom_components.oclean_ble.coordinator import (
     _in_window,
     _parse_poll_windows,
 )
+from custom_components.oclean_ble.models import OcleanDeviceData
 from custom_components.oclean_ble.parser import T1_C3352G_RECORD_SIZE
 
 
@@ -50,7 +52,7 @@ def _make_hass():
 
 def _make_coordinator(hass=None, mac="AA:BB:CC:DD:EE:FF", poll_interval=300):
     hass = hass or _make_hass()
-    return OcleanCoordinator(hass, mac, "Oclean", poll_interval)
+    return OcleanCoordinator(hass, None, mac, "Oclean", poll_interval)
 
 
 def _make_bleak_client(battery_value=75):
@@ -107,6 +109,32 @@ class TestPollDeviceSuccess:
         assert result[DATA_BATTERY] == 82
         assert coordinator.last_poll_successful is True
 
+    @pytest.mark.asyncio
+    async def test_battery_from_readiness_probe_is_not_read_again(self):
+        """The post-connect probe already read 0x2A19; the end-of-poll read is skipped."""
+        from custom_components.oclean_ble.const import BATTERY_CHAR_UUID
+
+        coordinator = _make_coordinator()
+        coordinator._dis_last_read_ts = 1.0e12  # DIS cached → no DIS reads
+        coordinator._last_raw = {DATA_MODEL_ID: "OCLEANY3M"}
+        client = _make_bleak_client(battery_value=64)
+
+        with (
+            patch("custom_components.oclean_ble.coordinator.bluetooth") as bt_mock,
+            patch(
+                "custom_components.oclean_ble.coordinator.establish_connection",
+                new_callable=AsyncMock,
+                return_value=client,
+            ),
+            patch("custom_components.oclean_ble.coordinator.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            self._patch_bt_with_device(bt_mock)
+            result = await coordinator._poll_device()
+
+        assert result[DATA_BATTERY] == 64
+        battery_reads = [c for c in client.read_gatt_char.await_args_list if c.args[0] == BATTERY_CHAR_UUID]
+        assert len(battery_reads) == 1
+
     @pytest.mark.asyncio
     async def test_time_calibration_sent(self):
         coordinator = _make_coordinator()
@@ -302,11 +330,35 @@ class TestPollDeviceFailure:
         assert result.battery == 55
         assert coordinator.last_poll_successful is False
 
+    @pytest.mark.asyncio
+    async def test_poll_failure_logs_traceback_via_exc_info(self, caplog):
+        """The traceback is attached to the DEBUG record, not pre-formatted into it."""
+        import logging
+
+        from bleak import BleakError
+
+        coordinator = _make_coordinator()
+        coordinator._last_raw = {DATA_BATTERY: 55}
+
+        with (
+            caplog.at_level(logging.DEBUG, logger="custom_components.oclean_ble.coordinator"),
+            patch("custom_components.oclean_ble.coordinator.bluetooth") as bt_mock,
+        ):
+            _bt_no_device(bt_mock)
+            await coordinator._async_update_data()
+
+        record = next(r for r in caplog.records if "poll failed" in r.getMessage())
+        assert record.exc_info is not None
+        assert record.exc_info[0] is BleakError
+        assert "Traceback" not in record.getMessage()
+
     @pytest.mark.asyncio
     async def test_disconnect_called_even_on_unexpected_error(self):
         """disconnect runs in finally even when asyncio.sleep raises unexpectedly."""
         coordinator = _make_coordinator()
         client = _make_bleak_client()
+        # Failing readiness probe → the post-connect settle sleep runs (and raises)
+        client.read_gatt_char = AsyncMock(side_effect=Exception("not ready"))
 
         with (
             patch("custom_components.oclean_ble.coordinator.bluetooth") as bt_mock,
@@ -372,8 +424,10 @@ class TestSessionEnrichment:
         )
 
         captured: list = []
+        slugs: list = []
 
-        async def fake_import(_hass, _mac_slug, _device_name, sessions, last_ts):
+        async def fake_import(_hass, mac_slug, _device_name, sessions, last_ts):
+            slugs.append(mac_slug)
             captured.extend(sessions)
             return last_ts
 
@@ -395,6 +449,7 @@ class TestSessionEnrichment:
         assert newest.get(DATA_LAST_BRUSH_SCORE) == 95, "Score from 0000 must be in session"
         assert isinstance(newest.get(DATA_LAST_BRUSH_AREAS), dict), "Areas from 2604 must be in session"
         assert newest.get(DATA_LAST_BRUSH_PRESSURE) == 18, "Pressure from 2604 must be in session"
+        assert slugs == ["aa_bb_cc_dd_ee_ff"]
 
     @pytest.mark.asyncio
     async def test_enrichment_does_not_overwrite_existing_session_fields(self):
@@ -614,6 +669,10 @@ class TestParsePollWindows:
         result = _parse_poll_windows("07:00-07:00")
         assert result == []
 
+    def test_out_of_range_time_skipped(self):
+        result = _parse_poll_windows("25:00-26:00, 07:60-08:00, 21:30-22:00")
+        assert result == [(dtime(21, 30), dtime(22, 0))]
+
     def test_overnight_window_preserved(self):
         result = _parse_poll_windows("23:00-01:00")
         assert result == [(dtime(23, 0), dtime(1, 0))]
@@ -828,22 +887,14 @@ class TestPollSkipReason:
         assert coord._poll_skip_reason() is None
 
     def test_outside_windows_returns_reason(self):
-        from custom_components.oclean_ble.coordinator import _parse_poll_windows
-
-        coord = _make_coordinator()
-        # Set windows to a range that is very unlikely to include now (midnight-00:01)
-        # To be safe, use both "00:00-00:01" and "23:59-00:00" and pick the opposite.
-        # Simplest: set a single window from 00:00 to 00:01 and ensure current time is outside.
-        # Use a 1-minute window at 00:00-00:01; if the test runs at 00:00, we fall back to no-op.
-        # Instead, set _poll_windows directly to a known-past window.
-        coord._poll_windows = _parse_poll_windows("00:00-00:01")
+        # A 1-minute window at 00:00-00:01; if the test runs at 00:00, we fall back to no-op.
+        coord = OcleanCoordinator(_make_hass(), None, "AA:BB:CC:DD:EE:FF", "Oclean", 300, poll_windows="00:00-00:01")
         import datetime
 
         if datetime.datetime.now().hour == 0 and datetime.datetime.now().minute == 0:
             return  # skip if window happens to be active now
         reason = coord._poll_skip_reason()
-        assert reason is not None
-        assert "outside poll windows" in reason
+        assert reason == "outside poll windows (00:00-00:01)"
 
     def test_inside_windows_returns_none(self):
         from custom_components.oclean_ble.coordinator import _parse_poll_windows
@@ -876,6 +927,18 @@ class TestAsyncUpdateDataSkip:
         result = await coord._async_update_data()
         assert result.battery == 80
 
+    @pytest.mark.asyncio
+    async def test_skip_returns_current_snapshot_unchanged(self):
+        """A skipped poll hands back the current data object, so nothing is re-built."""
+        import time
+
+        coord = _make_coordinator()
+        coord._store_loaded = True
+        coord._cooldown_until = time.time() + 3600
+        coord._last_raw = {DATA_BATTERY: 80}
+        coord.data = OcleanDeviceData.from_dict(coord._last_raw)
+        assert await coord._async_update_data() is coord.data
+
     @pytest.mark.asyncio
     async def test_skip_without_stale_data_bypasses_restriction_and_polls(self):
         # When no cached data exists, poll restrictions are bypassed so the
@@ -920,17 +983,54 @@ class TestAsyncUpdateDataSkip:
 
     @pytest.mark.asyncio
     async def test_save_store_called_after_poll_without_new_sessions(self):
-        # _save_store() must be called after every successful poll so that
+        # A store write must be scheduled after every successful poll so that
         # battery and model data survive an HA restart even when no new
         # brush sessions were detected.
         coord = _make_coordinator()
         coord._store_loaded = True
         client = _make_bleak_client(battery_value=60)
         saved: list[dict] = []
+        delays: list[float] = []
+
+        def _fake_delay_save(data_func, delay=0):
+            delays.append(delay)
+            saved.append(data_func())  # the Store calls data_func when it writes
+
+        coord._store.async_delay_save = _fake_delay_save
+
+        with (
+            patch("custom_components.oclean_ble.coordinator.bluetooth") as bt_mock,
+            patch(
+                "custom_components.oclean_ble.coordinator.establish_connection",
+                new_callable=AsyncMock,
+                return_value=client,
+            ),
+            patch("custom_components.oclean_ble.coordinator.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            bt_mock.async_last_service_info.return_value = _make_service_info()
+            await coord._async_update_data()
+
+        assert len(saved) == 1, "exactly one delayed store write per successful poll"
+        assert delays == [STORAGE_SAVE_DELAY]
+        assert saved[-1]["last_session"].get(DATA_BATTERY) == 60
+
+    @pytest.mark.asyncio
+    async def test_unload_flushes_delayed_save_before_reload(self):
+        # An options change reloads the entry and the new coordinator loads the
+        # store file at once; the delayed write of the last poll must be on disk
+        # by then, or already-counted sessions would look new again.
+        coord = _make_coordinator()
+        coord._store_loaded = True
+        coord._last_session_ts = 1_700_000_000
+        coord._brush_head_sw_count = 5
+        client = _make_bleak_client(battery_value=60)
+        disk: dict = {}
 
         async def _fake_save(data):
-            saved.append(data)
+            disk.clear()
+            disk.update(data)
 
+        coord._store.async_delay_save = MagicMock()  # delayed write has not fired yet
         coord._store.async_save = _fake_save
 
         with (
@@ -945,8 +1045,26 @@ class TestAsyncUpdateDataSkip:
             bt_mock.async_last_service_info.return_value = _make_service_info()
             await coord._async_update_data()
 
-        assert len(saved) >= 1, "_save_store must be called after every successful poll"
-        assert saved[-1]["last_session"].get(DATA_BATTERY) == 60
+        assert disk == {}
+        await coord.async_flush_store()
+
+        reloaded = _make_coordinator()
+        reloaded._store.async_load = AsyncMock(return_value=dict(disk))
+        await reloaded._load_store()
+
+        assert reloaded._last_session_ts == 1_700_000_000
+        assert reloaded._brush_head_sw_count == 5
+        assert reloaded._last_raw.get(DATA_BATTERY) == 60
+
+    @pytest.mark.asyncio
+    async def test_flush_store_skipped_before_store_loaded(self):
+        # Unloading before the first poll must not overwrite the file with defaults
+        coord = _make_coordinator()
+        coord._store.async_save = AsyncMock()
+
+        await coord.async_flush_store()
+
+        coord._store.async_save.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -1015,6 +1133,34 @@ class TestLoadStoreWithData:
         assert "last_session" in saved
         assert saved["last_session"][DATA_LAST_BRUSH_SCORE] == 88
 
+    @pytest.mark.asyncio
+    async def test_dis_cache_survives_restart(self):
+        """The DIS read time round-trips through the store, so the first poll after
+        a restart uses the persisted model/firmware instead of re-reading DIS."""
+        import time
+
+        saved: dict = {}
+
+        async def _fake_save(data):
+            saved.update(data)
+
+        coord = _make_coordinator()
+        coord._store.async_save = _fake_save
+        coord._dis_last_read_ts = time.time() - 60
+        coord._last_raw = {DATA_MODEL_ID: "OCLEANY3M", DATA_SW_VERSION: "1.0.0.20"}
+        await coord._save_store()
+
+        restarted = _make_coordinator()
+        restarted._store.async_load = AsyncMock(return_value=saved)
+        await restarted._load_store()
+        assert restarted._dis_last_read_ts == coord._dis_last_read_ts
+
+        client = _make_bleak_client()
+        collected: dict = {}
+        await restarted._read_device_info_service(client, collected)
+        client.read_gatt_char.assert_not_called()
+        assert collected[DATA_MODEL_ID] == "OCLEANY3M"
+
 
 # ---------------------------------------------------------------------------
 # _read_device_info_service – DIS cache path
@@ -1085,6 +1231,30 @@ class TestSendQueryCommandsWriteFailures:
         # At least the running-data writes were attempted
         assert client.write_gatt_char.call_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_logs_sent_and_skipped_commands_at_debug_only(self, caplog):
+        import logging
+
+        from bleak import BleakError
+
+        coord = _make_coordinator()
+        client = _make_bleak_client()
+        client.write_gatt_char = AsyncMock(side_effect=[BleakError("status failed")] + [None] * 10)
+        event = asyncio.Event()
+        event.set()
+
+        with caplog.at_level(logging.INFO, logger="custom_components.oclean_ble.coordinator"):
+            await coord._send_query_commands(client, event)
+        assert not [r for r in caplog.records if "command 0x" in r.getMessage()]
+
+        client.write_gatt_char = AsyncMock(side_effect=[BleakError("status failed")] + [None] * 10)
+        with caplog.at_level(logging.DEBUG, logger="custom_components.oclean_ble.coordinator"):
+            await coord._send_query_commands(client, event)
+        messages = [r.getMessage() for r in caplog.records if "command 0x" in r.getMessage()]
+        assert "skipped: status failed (BleakError)" in messages[0]
+        assert all("sent to ..." in m for m in messages[1:])
+        assert len(messages) == len(coord._protocol.query_commands)
+
 
 # ---------------------------------------------------------------------------
 # _import_new_sessions – recorder API available, statistics import
@@ -1107,25 +1277,10 @@ class TestImportNewSessionsWithRecorder:
 
         return _SD, _SM
 
-    @staticmethod
-    def _install_dt_util_stub():
-        """Install a homeassistant.util.dt stub with a real UTC tzinfo."""
-        import datetime
-        import sys
-        import types
-
-        dt_stub = types.ModuleType("homeassistant.util.dt")
-        dt_stub.UTC = datetime.UTC
-        util_stub = types.ModuleType("homeassistant.util")
-        util_stub.dt = dt_stub
-        sys.modules["homeassistant.util"] = util_stub
-        sys.modules["homeassistant.util.dt"] = dt_stub
-
     @pytest.mark.asyncio
     async def test_imports_new_session_and_updates_last_ts(self):
         from custom_components.oclean_ble.statistics import import_new_sessions
 
-        self._install_dt_util_stub()
         _SD, _SM = self._make_stat_classes()
         add_fn = MagicMock()
         hass = _make_hass()
@@ -1136,6 +1291,9 @@ class TestImportNewSessionsWithRecorder:
 
         assert new_ts == 1_700_000_001
         add_fn.assert_called()
+        # Rows are bucketed to the start of the UTC hour
+        row = add_fn.call_args.args[2][0]
+        assert row.start.isoformat() == "2023-11-14T22:00:00+00:00"
 
     @pytest.mark.asyncio
     async def test_no_new_sessions_skips_import(self):
@@ -1168,7 +1326,6 @@ class TestImportNewSessionsWithRecorder:
     async def test_area_stats_imported_when_present(self):
         from custom_components.oclean_ble.statistics import import_new_sessions
 
-        self._install_dt_util_stub()
         _SD, _SM = self._make_stat_classes()
         add_fn = MagicMock()
         hass = _make_hass()
@@ -1186,7 +1343,6 @@ class TestImportNewSessionsWithRecorder:
         """Exception in async_add_external_statistics must log and continue (lines 116-123)."""
         from custom_components.oclean_ble.statistics import import_new_sessions
 
-        self._install_dt_util_stub()
         _SD, _SM = self._make_stat_classes()
         add_fn = MagicMock(side_effect=Exception("stat write failed"))
         hass = _make_hass()
@@ -1203,7 +1359,6 @@ class TestImportNewSessionsWithRecorder:
         """Exception in async_add_external_statistics for area stats must continue (lines 156-162)."""
         from custom_components.oclean_ble.statistics import import_new_sessions
 
-        self._install_dt_util_stub()
         _SD, _SM = self._make_stat_classes()
         add_fn = MagicMock(side_effect=Exception("area stat write failed"))
         hass = _make_hass()
@@ -1215,6 +1370,31 @@ class TestImportNewSessionsWithRecorder:
 
         assert new_ts == 1_700_000_004
 
+    @pytest.mark.asyncio
+    async def test_statistic_names_and_ids(self):
+        """Metric and area statistics keep their display names and statistic IDs."""
+        from custom_components.oclean_ble.statistics import import_new_sessions
+
+        _SD, _SM = self._make_stat_classes()
+        add_fn = MagicMock()
+        hass = _make_hass()
+
+        with patch("custom_components.oclean_ble.statistics._load_recorder_api", return_value=(_SD, _SM, add_fn)):
+            sessions = [
+                {
+                    "last_brush_time": 1_700_000_005,
+                    DATA_LAST_BRUSH_SCORE: 90,
+                    DATA_LAST_BRUSH_AREAS: {"upper_left_out": 30},
+                }
+            ]
+            await import_new_sessions(hass, "aa_bb_cc_dd_ee_ff", "My Brush", sessions, 0)
+
+        labels = {(c.args[1].name, c.args[1].statistic_id) for c in add_fn.call_args_list}
+        assert labels == {
+            ("Oclean My Brush Brush Score", "oclean_ble:aa_bb_cc_dd_ee_ff_brush_score"),
+            ("Oclean My Brush Area Upper Left Out", "oclean_ble:aa_bb_cc_dd_ee_ff_area_upper_left_out"),
+        }
+
 
 # ---------------------------------------------------------------------------
 # _load_recorder_api – fallback import path (lines 37-53)
@@ -1248,6 +1428,7 @@ class TestLoadRecorderAPIFallback:
         rec_models.StatisticMetaData = FakeSM
 
         # Save and patch sys.modules
+        _load_recorder_api.cache_clear()
         old = {
             k: sys.modules.pop(k, None)
             for k in (
@@ -1260,6 +1441,7 @@ class TestLoadRecorderAPIFallback:
         try:
             result = _load_recorder_api()
         finally:
+            _load_recorder_api.cache_clear()
             sys.modules.pop("homeassistant.components.recorder.statistics", None)
             sys.modules.pop("homeassistant.components.recorder.models", None)
             for k, v in old.items():
@@ -1277,6 +1459,7 @@ class TestLoadRecorderAPIFallback:
 
         from custom_components.oclean_ble.statistics import _load_recorder_api
 
+        _load_recorder_api.cache_clear()
         old = {
             k: sys.modules.pop(k, None)
             for k in (
@@ -1287,12 +1470,25 @@ class TestLoadRecorderAPIFallback:
         try:
             result = _load_recorder_api()
         finally:
+            _load_recorder_api.cache_clear()
             for k, v in old.items():
                 if v is not None:
                     sys.modules[k] = v
 
         assert result is None
 
+    def test_lookup_runs_once(self):
+        """The import attempts run on the first call only; later calls hit the cache."""
+        from custom_components.oclean_ble.statistics import _load_recorder_api
+
+        _load_recorder_api.cache_clear()
+        try:
+            first = _load_recorder_api()
+            assert _load_recorder_api() is first
+            assert _load_recorder_api.cache_info().misses == 1
+        finally:
+            _load_recorder_api.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # _calibrate_time – write failure path (lines 583-587)
@@ -1317,15 +1513,21 @@ class TestCalibrateTimeWriteFailure:
 
 class TestBatteryReadFailure:
     @pytest.mark.asyncio
-    async def test_read_failure_does_not_raise(self):
+    async def test_read_failure_does_not_raise(self, caplog):
         """Exception in read_gatt_char for battery must log a warning and not crash."""
+        import logging
+
         coord = _make_coordinator()
         client = _make_bleak_client()
         client.read_gatt_char = AsyncMock(side_effect=Exception("read failed"))
         collected: dict = {}
         # Must not raise
-        await coord._read_battery_and_unsubscribe(client, collected)
+        with caplog.at_level(logging.DEBUG, logger="custom_components.oclean_ble.coordinator"):
+            await coord._read_battery_and_unsubscribe(client, collected)
         assert DATA_BATTERY not in collected
+        warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1
+        assert "battery read failed: read failed (Exception)" in warnings[0].getMessage()
 
     @pytest.mark.asyncio
     async def test_notification_value_skips_read(self):
@@ -1465,6 +1667,63 @@ class TestSubscribeNotificationsRetry:
         assert len(subscribed) == 0
         client.stop_notify.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_subscriptions_are_issued_one_at_a_time(self):
+        """Subscribes must not overlap; BlueZ and ESPHome proxies reject concurrent GATT ops."""
+        from custom_components.oclean_ble.protocol import TYPE1
+
+        coord = _make_coordinator()
+        coord._protocol = TYPE1
+        client = _make_bleak_client()
+        in_flight = 0
+        peak = 0
+
+        async def _fake_start_notify(_uuid, _handler):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        client.start_notify = AsyncMock(side_effect=_fake_start_notify)
+        handler = lambda _char, _data: None  # noqa: E731
+        subscribed = await coord._subscribe_notifications(client, handler)
+
+        assert subscribed == frozenset(TYPE1.notify_chars)
+        assert peak == 1
+
+
+# ---------------------------------------------------------------------------
+# _wait_for_gatt_ready – post-connect settle delay
+# ---------------------------------------------------------------------------
+
+
+class TestWaitForGattReady:
+    @pytest.mark.asyncio
+    async def test_successful_probe_skips_settle_delay(self):
+        """A successful battery read means the GATT table is live – no sleep."""
+        from custom_components.oclean_ble.const import BATTERY_CHAR_UUID
+        from custom_components.oclean_ble.coordinator import _wait_for_gatt_ready
+
+        client = _make_bleak_client()
+        with patch("custom_components.oclean_ble.coordinator.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await _wait_for_gatt_ready(client)
+        client.read_gatt_char.assert_awaited_once_with(BATTERY_CHAR_UUID)
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_sleeps_remaining_delay(self):
+        """A failing probe falls back to the (remaining) fixed settle delay."""
+        from custom_components.oclean_ble.const import BLE_POST_CONNECT_DELAY
+        from custom_components.oclean_ble.coordinator import _wait_for_gatt_ready
+
+        client = _make_bleak_client()
+        client.read_gatt_char = AsyncMock(side_effect=Exception("Invalid handle"))
+        with patch("custom_components.oclean_ble.coordinator.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await _wait_for_gatt_ready(client)
+        sleep.assert_awaited_once()
+        assert 0 < sleep.await_args.args[0] <= BLE_POST_CONNECT_DELAY
+
 
 # ---------------------------------------------------------------------------
 # _read_device_info_service – device registry update path (lines 556-576)
@@ -1569,7 +1828,7 @@ class TestPollDeviceHwBrushAndCooldown:
         """_cooldown_until must be set in the future when new sessions arrive and cooldown is configured."""
         import time
 
-        coord = OcleanCoordinator(_make_hass(), "AA:BB:CC:DD:EE:FF", "Oclean", 300, post_brush_cooldown_h=1)
+        coord = OcleanCoordinator(_make_hass(), None, "AA:BB:CC:DD:EE:FF", "Oclean", 300, post_brush_cooldown_h=1)
         coord._store_loaded = True
         coord._last_session_ts = 0
         client = _make_bleak_client()
@@ -1624,6 +1883,9 @@ class TestAsyncSyncTime:
         cmd_bytes = client.write_gatt_char.call_args[0][1]
         assert cmd_bytes[:2] == bytes.fromhex("020E"), "Must send 020E time-calibration command"
         assert len(cmd_bytes) == 6, "020E + 4-byte timestamp = 6 bytes"
+        import time
+
+        assert abs(int.from_bytes(cmd_bytes[2:], "big") - time.time()) < 60, "timestamp must be big-endian now"
         client.disconnect.assert_awaited_once()
 
     @pytest.mark.asyncio
@@ -1978,6 +2240,34 @@ class TestReadDeviceInfoServiceCacheExpiry:
         client.read_gatt_char.assert_called()  # must NOT skip
         assert collected[DATA_MODEL_ID] == "OCLEANY3S"
 
+    @pytest.mark.asyncio
+    async def test_dis_reads_are_issued_one_at_a_time(self):
+        """DIS reads must not overlap (ATT allows one outstanding request per connection)."""
+        from custom_components.oclean_ble.const import DATA_HW_REVISION, DATA_MODEL_ID, DATA_SW_VERSION
+
+        coord = _make_coordinator()
+        in_flight = 0
+        peak = 0
+
+        async def _read(uuid):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return bytearray(uuid[4:8].encode())  # 16-bit characteristic UUID
+
+        client = _make_bleak_client()
+        client.read_gatt_char = AsyncMock(side_effect=_read)
+        collected: dict = {}
+        await coord._read_device_info_service(client, collected)
+
+        assert peak == 1
+        # Results are matched to the right keys
+        assert collected[DATA_MODEL_ID] == "2a24"
+        assert collected[DATA_HW_REVISION] == "2a27"
+        assert collected[DATA_SW_VERSION] == "2a28"
+
 
 # ---------------------------------------------------------------------------
 # Manual poll mode (poll_interval=0 → update_interval=None)
@@ -1997,6 +2287,11 @@ class TestManualPollMode:
         coord = _make_coordinator(poll_interval=300)
         assert coord.update_interval == timedelta(seconds=300)
 
+    def test_config_entry_forwarded_to_base_coordinator(self):
+        entry = MagicMock()
+        coord = OcleanCoordinator(_make_hass(), entry, "AA:BB:CC:DD:EE:FF", "Oclean", 300)
+        assert coord.config_entry is entry
+
     @pytest.mark.asyncio
     async def test_async_request_refresh_triggers_poll_in_manual_mode(self):
         """async_request_refresh() must poll the device even in manual mode."""
@@ -2300,6 +2595,29 @@ class TestT1StreamTruncationRobustness:
         assert result2[DATA_LAST_BRUSH_TIME] == result1[DATA_LAST_BRUSH_TIME]
 
 
+# ---------------------------------------------------------------------------
+# _finalize_sessions – session listing
+# ---------------------------------------------------------------------------
+
+
+class TestFinalizeSessionsLogging:
+    def test_session_listing_is_one_debug_record(self, caplog):
+        import logging
+
+        coord = _make_coordinator()
+        coord._last_session_ts = 1_700_000_000
+        sessions = [{DATA_LAST_BRUSH_TIME: 1_700_000_600}, {DATA_LAST_BRUSH_TIME: 1_699_999_000}]
+        with caplog.at_level(logging.DEBUG, logger="custom_components.oclean_ble.coordinator"):
+            coord._finalize_sessions({}, sessions)
+
+        records = [r for r in caplog.records if "fetched 2 session(s)" in r.getMessage()]
+        assert len(records) == 1
+        message = records[0].getMessage()
+        assert "session[0]: ts=1700000600" in message
+        assert message.endswith("known")
+        assert "NEW" in message
+
+
 # ---------------------------------------------------------------------------
 # _CoordLoggerAdapter – per-device log prefix
 # ---------------------------------------------------------------------------
@@ -2600,6 +2918,36 @@ class TestPollReceiveBrushFallback:
             # Must not raise
             await coord._poll_receive_brush_fallback(client, handler, session_received)
 
+    @pytest.mark.asyncio
+    async def test_handler_error_on_fbb86_data_is_contained(self):
+        """A parser error on fbb86 bytes must not escape the fallback (same as fbb90)."""
+        coord = _make_coordinator()
+        coord._store_loaded = True
+
+        fbb86_payload = bytearray([0x02, 0x03, 0x00, 0x01])
+
+        async def _read(uuid):
+            from custom_components.oclean_ble.const import READ_NOTIFY_CHAR_UUID
+
+            return fbb86_payload if uuid == READ_NOTIFY_CHAR_UUID else bytearray([0x00])
+
+        client = AsyncMock()
+        client.read_gatt_char = AsyncMock(side_effect=_read)
+        calls: list[bytearray] = []
+
+        def handler(_sender, data: bytearray) -> None:
+            calls.append(data)
+            raise ValueError("bad record")
+
+        session_received = asyncio.Event()
+
+        with patch("custom_components.oclean_ble.coordinator.asyncio.sleep", new_callable=AsyncMock):
+            # Must not raise
+            await coord._poll_receive_brush_fallback(client, handler, session_received)
+
+        # The payload was dispatched once; later identical reads are deduplicated
+        assert calls == [fbb86_payload]
+
 
 # ---------------------------------------------------------------------------
 # async_reset_brush_head – brush head counter reset
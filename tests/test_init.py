@@ -11,7 +11,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from custom_components.oclean_ble import (
     _FILE_HANDLER_KEY,
+    _STOP_LISTENER_KEY,
     PLATFORMS,
+    _apply_file_log_level,
     _attach_file_handler,
     _build_file_handler,
     _detach_file_handler,
@@ -20,6 +22,7 @@ from custom_components.oclean_ble import (
 )
 from custom_components.oclean_ble.const import (
     CONF_DEVICE_NAME,
+    CONF_FILE_LOG_LEVEL,
     CONF_MAC_ADDRESS,
     DOMAIN,
     SERVICE_POLL,
@@ -103,35 +106,91 @@ class TestBuildFileHandler:
             handler.close()
             log_path.unlink(missing_ok=True)
 
+    def test_formatter_shared_between_handlers(self):
+        log_path = pathlib.Path(_TMPDIR) / "oclean_test_fmt.log"
+        first = _build_file_handler(log_path)
+        second = _build_file_handler(log_path)
+        try:
+            assert first.formatter is second.formatter
+        finally:
+            first.close()
+            second.close()
+            log_path.unlink(missing_ok=True)
+
 
 # ---------------------------------------------------------------------------
 # _attach_file_handler / _detach_file_handler
 # ---------------------------------------------------------------------------
 
 
+def _teardown(handlers) -> None:
+    """Detach and close the objects stored by _attach_file_handler."""
+    queue_handler, listener, file_handler = handlers
+    logging.getLogger("custom_components.oclean_ble").removeHandler(queue_handler)
+    listener.stop()
+    file_handler.close()
+
+
 class TestAttachFileHandler:
-    def test_attaches_handler_to_logger(self):
+    def test_attaches_queue_handler_to_logger(self):
         hass = _make_hass()
         asyncio.run(_attach_file_handler(hass))
-        handler = hass.data[DOMAIN][_FILE_HANDLER_KEY]
-        assert handler is not None
-        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+        handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        queue_handler, listener, file_handler = handlers
+        assert isinstance(queue_handler, logging.handlers.QueueHandler)
+        assert isinstance(file_handler, logging.handlers.RotatingFileHandler)
+        assert listener.handlers == (file_handler,)
         oclean_logger = logging.getLogger("custom_components.oclean_ble")
-        assert handler in oclean_logger.handlers
-        oclean_logger.removeHandler(handler)
-        handler.close()
+        assert queue_handler in oclean_logger.handlers
+        # The file handler is driven by the listener thread, never by the logger
+        assert file_handler not in oclean_logger.handlers
+        _teardown(handlers)
+
+    def test_builds_handler_in_executor(self):
+        hass = _make_hass()
+        asyncio.run(_attach_file_handler(hass))
+        handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        # open() inside RotatingFileHandler must never run on the event loop
+        build_call = hass.async_add_executor_job.await_args_list[0]
+        assert build_call.args[0] is _build_file_handler
+        _teardown(handlers)
+
+    def test_no_loop_timer_scheduled(self):
+        hass = _make_hass()
+        asyncio.run(_attach_file_handler(hass))
+        handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        # The listener thread writes every record; nothing is left to flush from the loop
+        hass.loop.call_later.assert_not_called()
+        _teardown(handlers)
+
+    def test_detaches_on_homeassistant_stop(self, tmp_path):
+        hass = _make_hass(str(tmp_path))
+        asyncio.run(_attach_file_handler(hass))
+        hass.bus.async_listen_once.assert_called_once()
+        event_type, on_stop = hass.bus.async_listen_once.call_args[0]
+        assert event_type == "homeassistant_stop"
+        remove_stop_listener = hass.data[DOMAIN][_STOP_LISTENER_KEY]
+        file_handler = hass.data[DOMAIN][_FILE_HANDLER_KEY][2]
+
+        logging.getLogger("custom_components.oclean_ble.test").warning("record before stop")
+        asyncio.run(on_stop(MagicMock()))
+
+        assert _FILE_HANDLER_KEY not in hass.data[DOMAIN]
+        assert file_handler.stream is None  # file closed
+        assert "record before stop" in (tmp_path / "oclean_ble.log").read_text(encoding="utf-8")
+        # The listener has fired, so it must not be removed again
+        remove_stop_listener.assert_not_called()
 
     def test_idempotent_second_call_no_op(self):
         hass = _make_hass()
         asyncio.run(_attach_file_handler(hass))
-        first_handler = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        first_handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
         asyncio.run(_attach_file_handler(hass))
-        assert hass.data[DOMAIN][_FILE_HANDLER_KEY] is first_handler
+        assert hass.data[DOMAIN][_FILE_HANDLER_KEY] is first_handlers
         oclean_logger = logging.getLogger("custom_components.oclean_ble")
-        count = sum(1 for h in oclean_logger.handlers if h is first_handler)
+        count = sum(1 for h in oclean_logger.handlers if h is first_handlers[0])
         assert count == 1
-        oclean_logger.removeHandler(first_handler)
-        first_handler.close()
+        _teardown(first_handlers)
 
     def test_sentinel_prevents_concurrent_attach(self):
         hass = _make_hass()
@@ -144,12 +203,28 @@ class TestDetachFileHandler:
     def test_removes_handler_and_closes(self):
         hass = _make_hass()
         asyncio.run(_attach_file_handler(hass))
-        handler = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        queue_handler, _listener, file_handler = hass.data[DOMAIN][_FILE_HANDLER_KEY]
         oclean_logger = logging.getLogger("custom_components.oclean_ble")
-        assert handler in oclean_logger.handlers
+        assert queue_handler in oclean_logger.handlers
         asyncio.run(_detach_file_handler(hass))
         assert _FILE_HANDLER_KEY not in hass.data.get(DOMAIN, {})
-        assert handler not in oclean_logger.handlers
+        assert queue_handler not in oclean_logger.handlers
+        assert file_handler.stream is None  # file closed
+
+    def test_queued_records_reach_file_on_detach(self, tmp_path):
+        hass = _make_hass(str(tmp_path))
+        asyncio.run(_attach_file_handler(hass))
+        logging.getLogger("custom_components.oclean_ble.test").warning("queued record")
+        asyncio.run(_detach_file_handler(hass))
+        assert "queued record" in (tmp_path / "oclean_ble.log").read_text(encoding="utf-8")
+
+    def test_removes_stop_listener(self):
+        hass = _make_hass()
+        asyncio.run(_attach_file_handler(hass))
+        remove_stop_listener = hass.data[DOMAIN][_STOP_LISTENER_KEY]
+        asyncio.run(_detach_file_handler(hass))
+        remove_stop_listener.assert_called_once()
+        assert _STOP_LISTENER_KEY not in hass.data[DOMAIN]
 
     def test_no_op_when_no_handler(self):
         hass = _make_hass()
@@ -162,6 +237,55 @@ class TestDetachFileHandler:
         assert _FILE_HANDLER_KEY not in hass.data[DOMAIN]
 
 
+class TestApplyFileLogLevel:
+    def _attached_hass(self, *level_options: dict) -> MagicMock:
+        hass = _make_hass()
+        asyncio.run(_attach_file_handler(hass))
+        hass.config_entries.async_entries = MagicMock(return_value=[MagicMock(options=o) for o in level_options])
+        return hass
+
+    def test_defaults_to_info(self):
+        hass = self._attached_hass({})
+        handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        _apply_file_log_level(hass)
+        assert handlers[0].level == logging.INFO
+        _teardown(handlers)
+
+    def test_most_verbose_entry_wins(self):
+        hass = self._attached_hass({CONF_FILE_LOG_LEVEL: "INFO"}, {CONF_FILE_LOG_LEVEL: "DEBUG"})
+        handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        _apply_file_log_level(hass)
+        assert handlers[0].level == logging.DEBUG
+        _teardown(handlers)
+
+    def test_no_op_before_attach(self):
+        hass = _make_hass()
+        _apply_file_log_level(hass)
+        hass.config_entries.async_entries.assert_not_called()
+
+    @patch("custom_components.oclean_ble.OcleanCoordinator")
+    def test_unloading_debug_entry_restores_remaining_level(self, mock_coord_cls):
+        hass = _make_hass()
+        mock_coord_cls.return_value = MagicMock(async_refresh=AsyncMock())
+        debug_entry = _make_entry("debug_entry")
+        debug_entry.options = {CONF_FILE_LOG_LEVEL: "DEBUG"}
+        info_entry = _make_entry("info_entry")
+        # The unloading entry is still listed by async_entries() during unload
+        hass.config_entries.async_entries = MagicMock(return_value=[debug_entry, info_entry])
+
+        asyncio.run(async_setup_entry(hass, debug_entry))
+        hass.services.has_service = MagicMock(return_value=True)
+        asyncio.run(async_setup_entry(hass, info_entry))
+        handlers = hass.data[DOMAIN][_FILE_HANDLER_KEY]
+        assert handlers[0].level == logging.DEBUG
+
+        asyncio.run(async_unload_entry(hass, debug_entry))
+
+        assert hass.data[DOMAIN][_FILE_HANDLER_KEY] is handlers
+        assert handlers[0].level == logging.INFO
+        _teardown(handlers)
+
+
 # ---------------------------------------------------------------------------
 # async_setup_entry
 # ---------------------------------------------------------------------------
@@ -206,6 +330,28 @@ class TestAsyncSetupEntry:
 
         mock_coord.async_refresh.assert_awaited_once()
 
+    @patch("custom_components.oclean_ble._attach_file_handler", new_callable=AsyncMock)
+    @patch("custom_components.oclean_ble.OcleanCoordinator")
+    def test_failed_first_refresh_does_not_fail_setup(self, mock_coord_cls, mock_attach):
+        """A sleeping device must not put the entry into the ConfigEntryNotReady retry loop."""
+        hass = _make_hass()
+        entry = _make_entry()
+        mock_coord = MagicMock(async_refresh=AsyncMock(), last_update_success=False, data=None)
+
+        def _refresh_sees_registered_coordinator():
+            # The coordinator is registered (and platforms set up) before the first poll
+            assert hass.data[DOMAIN][entry.entry_id] is mock_coord
+            hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+
+        mock_coord.async_refresh.side_effect = _refresh_sees_registered_coordinator
+        mock_coord_cls.return_value = mock_coord
+
+        result = asyncio.run(async_setup_entry(hass, entry))
+
+        assert result is True
+        mock_coord.async_refresh.assert_awaited_once()
+        mock_coord.async_config_entry_first_refresh.assert_not_called()
+
     @patch("custom_components.oclean_ble._attach_file_handler", new_callable=AsyncMock)
     @patch("custom_components.oclean_ble.OcleanCoordinator")
     def test_registers_poll_service(self, mock_coord_cls, mock_attach):
@@ -244,9 +390,10 @@ class TestAsyncSetupEntry:
         mock_coord_cls.assert_called_once()
         args, kwargs = mock_coord_cls.call_args
         assert args[0] is hass
-        assert args[1] == "AA:BB:CC:DD:EE:FF"
-        assert args[2] == "Oclean"
-        assert args[3] == 300  # DEFAULT_POLL_INTERVAL
+        assert args[1] is entry
+        assert args[2] == "AA:BB:CC:DD:EE:FF"
+        assert args[3] == "Oclean"
+        assert args[4] == 300  # DEFAULT_POLL_INTERVAL
 
 
 # ---------------------------------------------------------------------------
@@ -255,6 +402,19 @@ class TestAsyncSetupEntry:
 
 
 class TestAsyncUnloadEntry:
+    @patch("custom_components.oclean_ble._attach_file_handler", new_callable=AsyncMock)
+    @patch("custom_components.oclean_ble.OcleanCoordinator")
+    def test_registers_store_flush_on_unload(self, mock_coord_cls, mock_attach):
+        hass = _make_hass()
+        entry = _make_entry()
+        entry.async_on_unload = MagicMock()
+        coordinator = MagicMock(async_refresh=AsyncMock())
+        mock_coord_cls.return_value = coordinator
+
+        asyncio.run(async_setup_entry(hass, entry))
+
+        entry.async_on_unload.assert_any_call(coordinator.async_flush_store)
+
     @patch("custom_components.oclean_ble._detach_file_handler", new_callable=AsyncMock)
     @patch("custom_components.oclean_ble._attach_file_handler", new_callable=AsyncMock)
     @patch("custom_components.oclean_ble.OcleanCoordinator")
@@ -91,8 +91,10 @@ class TestOcleanNumberSetNativeValue:
     @pytest.mark.asyncio
     async def test_calls_coordinator_setter(self):
         number, coord = _make_number("brush_head_max_days")
+        number.async_write_ha_state = MagicMock()
         await number.async_set_native_value(120.0)
         coord.async_set_brush_head_max_days.assert_awaited_once_with(120)
+        number.async_write_ha_state.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
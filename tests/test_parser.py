@@ -243,6 +243,15 @@ class TestParseNotificationRouting:
         result = parse_notification(data)
         assert result["battery"] == 29
 
+    def test_returns_fresh_dict_per_call(self):
+        # The coordinator keeps the returned dict without copying it
+        data = bytes([0x03, 0x03, 0x02, 0x0E, 0x4B, 0x1D, 0x00, 0x00])
+        first = parse_notification(data)
+        second = parse_notification(data)
+        assert first is not second
+        first["battery"] = 0
+        assert second["battery"] == 29
+
     def test_state_response_routed_minimal(self):
         # 03 03 + short payload (< 4 bytes) → no battery
         data = bytes([0x03, 0x03, 0x02])
@@ -244,6 +244,10 @@ class TestOcleanSchemeSensor:
         sensor = _make_scheme_sensor(data={DATA_LAST_BRUSH_PNUM: pnum})
         assert sensor.native_value == name
 
+    def test_scheme_names_is_read_only(self):
+        with pytest.raises(TypeError):
+            SCHEME_NAMES[9999] = "Patched"  # type: ignore[index]
+
     def test_native_value_unknown_pnum_returns_string(self):
         unknown_pnum = 9999
         assert unknown_pnum not in SCHEME_NAMES
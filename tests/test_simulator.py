@@ -39,7 +39,7 @@ def _make_hass():
 
 
 def _make_coordinator(mac: str = "AA:BB:CC:DD:EE:FF") -> OcleanCoordinator:
-    coord = OcleanCoordinator(_make_hass(), mac, "Oclean", 300)
+    coord = OcleanCoordinator(_make_hass(), None, mac, "Oclean", 300)
     coord._store_loaded = True  # skip async store load on first poll
     return coord
 
@@ -100,8 +100,10 @@ class TestOcleanSwitchTurnOnOff:
     @pytest.mark.asyncio
     async def test_turn_on_calls_setter(self, key, setter):
         switch, coord = _make_switch(key)
+        switch.async_write_ha_state = MagicMock()
         await switch.async_turn_on()
         getattr(coord, setter).assert_awaited_once_with(True)
+        switch.async_write_ha_state.assert_called_once()
 
     @pytest.mark.parametrize(
         ("key", "setter"),
@@ -115,8 +117,10 @@ class TestOcleanSwitchTurnOnOff:
     @pytest.mark.asyncio
     async def test_turn_off_calls_setter(self, key, setter):
         switch, coord = _make_switch(key)
+        switch.async_write_ha_state = MagicMock()
         await switch.async_turn_off()
         getattr(coord, setter).assert_awaited_once_with(False)
+        switch.async_write_ha_state.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -271,10 +271,12 @@ def main() -> None:
     if combined:
         print(f"Found {len(combined)} pNum → scheme name mapping(s):\n")
         print("# Paste into custom_components/oclean_ble/const.py:")
-        print("SCHEME_NAMES: dict[int, str] = {")
+        print("SCHEME_NAMES: Final[Mapping[int, str]] = MappingProxyType(")
+        print("    {")
         for pnum in sorted(combined):
-            print(f"    {pnum}: {combined[pnum]!r},")
-        print("}")
+            print(f"        {pnum}: {combined[pnum]!r},")
+        print("    }")
+        print(")")
     else:
         print("No scheme name mappings found.")
         print("Try running with --login --dump-raw and inspect the raw JSON files.")